@@ -20,18 +20,46 @@ Example:
 
 from __future__ import annotations
 
+import random
 import threading
 import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import TYPE_CHECKING
+from urllib.parse import urlencode
+from weakref import WeakValueDictionary
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 if TYPE_CHECKING:
     from stkai._config import AuthConfig
 
 
+# Shared by all providers, so token refreshes reuse pooled connections (and their TLS handshakes).
+# Token requests are safe to repeat, so transient connection errors and 429/5xx responses are
+# retried with backoff on the same pool before the provider gives up.
+# Fetches run under the provider's lock, so a server-sent Retry-After is ignored and backoff is
+# capped: sleeps are 0s, 0.5s and 1s, and a fetch takes at most 4 attempts x _TOKEN_REQUEST_TIMEOUT
+# plus 1.5s of backoff.
+_TOKEN_REQUEST_RETRY = Retry(
+    total=3,
+    status_forcelist=(429, 502, 503, 504),
+    backoff_factor=0.25,
+    backoff_max=1.0,
+    respect_retry_after_header=False,
+    allowed_methods=frozenset({"POST"}),
+    raise_on_status=False,
+)
+_TOKEN_REQUEST_TIMEOUT = 30
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(max_retries=_TOKEN_REQUEST_RETRY, pool_maxsize=16))
+_SESSION.mount("http://", HTTPAdapter(max_retries=_TOKEN_REQUEST_RETRY, pool_maxsize=16))
+
+
 # =============================================================================
 # Exceptions
 # =============================================================================
@@ -66,18 +94,30 @@ class AuthenticationError(Exception):
 # =============================================================================
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TokenInfo:
     """
     Token with expiration metadata.
 
+    Immutable, so a cached instance can be read safely without holding the provider's lock.
+
     Attributes:
         access_token: The OAuth2 access token.
-        expires_at: Unix timestamp when the token expires.
+        expires_at: `time.monotonic()` reading at which the token expires.
+        refresh_at: `time.monotonic()` reading after which the token should be refreshed.
+            If None, the provider's refresh margin before `expires_at` is used.
+        auth_headers: Read-only Bearer authorization headers, built once per token.
     """
 
     access_token: str
     expires_at: float
+    refresh_at: float | None = None
+    auth_headers: Mapping[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "auth_headers", MappingProxyType({"Authorization": f"Bearer {self.access_token}"})
+        )
 
 
 # =============================================================================
@@ -115,12 +155,12 @@ class AuthProvider(ABC):
         """
         pass
 
-    def get_auth_headers(self) -> dict[str, str]:
+    def get_auth_headers(self) -> Mapping[str, str]:
         """
         Return authorization headers for HTTP requests.
 
         Returns:
-            Dict with Authorization header containing Bearer token.
+            Mapping with Authorization header containing Bearer token.
 
         Example:
             >>> headers = auth.get_auth_headers()
@@ -145,10 +185,17 @@ class ClientCredentialsAuthProvider(AuthProvider):
         - Token caching: Avoids unnecessary token requests.
         - Auto-refresh: Automatically refreshes tokens before expiration.
         - Thread-safe: Safe for use across multiple threads.
+        - Connection reuse: Token requests share a pooled `requests.Session`.
+        - Resilience: Transient connection errors and 429/502/503/504 responses
+          are retried (up to 3 times, with at most 1s of backoff between attempts)
+          before failing. Retry-After headers are ignored, so the worst-case fetch
+          is 4 attempts at the 30s request timeout plus 1.5s of backoff (~2 min).
 
     Attributes:
         DEFAULT_TOKEN_URL: Default StackSpot OAuth2 token endpoint.
         DEFAULT_REFRESH_MARGIN: Seconds before expiration to refresh (60s).
+        REFRESH_MARGIN_JITTER: Fraction by which each token's refresh margin is
+            randomized (±10%), so providers sharing credentials don't refresh in lockstep.
 
     Example:
         >>> auth = ClientCredentialsAuthProvider(
@@ -167,6 +214,8 @@ class ClientCredentialsAuthProvider(AuthProvider):
 
     DEFAULT_TOKEN_URL = "https://idm.stackspot.com/stackspot-dev/oidc/oauth/token"
     DEFAULT_REFRESH_MARGIN = 60  # Refresh 1 min before expiration
+    REFRESH_MARGIN_JITTER = 0.1
+    _TOKEN_REQUEST_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
 
     def __init__(
         self,
@@ -182,6 +231,12 @@ class ClientCredentialsAuthProvider(AuthProvider):
         self._client_secret = client_secret
         self._token_url = token_url
         self._refresh_margin = refresh_margin
+        # Credentials never change, so the form body is encoded once instead of on every refresh
+        self._token_request_body = urlencode({
+            "grant_type": "client_credentials",
+            "client_id": client_id,
+            "client_secret": client_secret,
+        }).encode("ascii")
 
         self._token: TokenInfo | None = None
         self._lock = threading.Lock()
@@ -191,8 +246,9 @@ class ClientCredentialsAuthProvider(AuthProvider):
         Obtain a valid access token, fetching a new one if necessary.
 
         This method is thread-safe. If the current token is valid (not expired
-        and not within the refresh margin), it returns the cached token.
-        Otherwise, it fetches a new token from the OAuth2 endpoint.
+        and not within the refresh margin), it returns the cached token without
+        taking the lock. Otherwise, it fetches a new token from the OAuth2 endpoint,
+        so concurrent callers wait for a single refresh.
 
         Returns:
             Valid access token string.
@@ -200,19 +256,51 @@ class ClientCredentialsAuthProvider(AuthProvider):
         Raises:
             AuthenticationError: If unable to obtain a valid token.
         """
-        with self._lock:
-            if self._is_token_valid():
-                assert self._token is not None  # for type checker
-                return self._token.access_token
+        return self._get_valid_token().access_token
+
+    def get_auth_headers(self) -> Mapping[str, str]:
+        """
+        Return authorization headers for HTTP requests.
+
+        The headers are built once per token and returned as a read-only mapping,
+        so calls made while the token is valid don't allocate.
 
-            self._token = self._fetch_new_token()
-            return self._token.access_token
+        Returns:
+            Read-only mapping with Authorization header containing Bearer token.
+
+        Raises:
+            AuthenticationError: If unable to obtain a valid token.
+        """
+        return self._get_valid_token().auth_headers
 
-    def _is_token_valid(self) -> bool:
-        """Check if current token exists and is not near expiration."""
-        if self._token is None:
+    def _get_valid_token(self) -> TokenInfo:
+        """Return the cached token if still valid, otherwise fetch a new one (thread-safe)."""
+        # Lock-free fast path: TokenInfo is replaced, never mutated, so one read is consistent
+        token = self._token
+        if self._is_token_valid(token):
+            assert token is not None  # for type checker
+            return token
+
+        with self._lock:
+            # Double-check: another thread may have refreshed it while we waited for the lock
+            token = self._token
+            if self._is_token_valid(token):
+                assert token is not None  # for type checker
+                return token
+
+            token = self._fetch_new_token()
+            self._token = token
+            return token
+
+    def _is_token_valid(self, token: TokenInfo | None) -> bool:
+        """Check if the given token exists and is not near expiration."""
+        if token is None:
             return False
-        return time.time() < (self._token.expires_at - self._refresh_margin)
+        refresh_at = token.refresh_at
+        if refresh_at is None:
+            refresh_at = token.expires_at - self._refresh_margin
+        # Monotonic clock: wall-clock adjustments (e.g. NTP) must not cause early or late refreshes
+        return time.monotonic() < refresh_at
 
     def _fetch_new_token(self) -> TokenInfo:
         """
@@ -225,24 +313,24 @@ class ClientCredentialsAuthProvider(AuthProvider):
             AuthenticationError: If the token request fails.
         """
         try:
-            response = requests.post(
+            response = _SESSION.post(
                 self._token_url,
-                data={
-                    "grant_type": "client_credentials",
-                    "client_id": self._client_id,
-                    "client_secret": self._client_secret,
-                },
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-                timeout=30,
+                data=self._token_request_body,
+                headers=self._TOKEN_REQUEST_HEADERS,
+                timeout=_TOKEN_REQUEST_TIMEOUT,
             )
             response.raise_for_status()
 
             data = response.json()
             expires_in = data.get("expires_in", 1199)
 
+            expires_at = time.monotonic() + expires_in
+            jitter = self.REFRESH_MARGIN_JITTER
+            refresh_margin = self._refresh_margin * random.uniform(1 - jitter, 1 + jitter)
             return TokenInfo(
                 access_token=data["access_token"],
-                expires_at=time.time() + expires_in,
+                expires_at=expires_at,
+                refresh_at=expires_at - refresh_margin,
             )
 
         except requests.HTTPError as e:
@@ -266,6 +354,10 @@ class ClientCredentialsAuthProvider(AuthProvider):
 # Helper Functions
 # =============================================================================
 
+# Live providers created by create_standalone_auth(), keyed by credentials and token URL
+_PROVIDER_REGISTRY: WeakValueDictionary[tuple[str, str, str], ClientCredentialsAuthProvider] = WeakValueDictionary()
+_PROVIDER_REGISTRY_LOCK = threading.Lock()
+
 
 def create_standalone_auth(config: AuthConfig | None = None) -> ClientCredentialsAuthProvider:
     """
@@ -274,6 +366,10 @@ def create_standalone_auth(config: AuthConfig | None = None) -> ClientCredential
     This helper function creates an auth provider using credentials from
     the provided config or from the global STKAI.config.
 
+    Providers are shared per (client_id, client_secret, token_url) while they are
+    in use, so every caller with the same credentials reuses one token cache
+    instead of fetching its own token.
+
     Args:
         config: Optional AuthConfig with credentials. If None, uses
             STKAI.config.auth from global configuration.
@@ -302,8 +398,14 @@ def create_standalone_auth(config: AuthConfig | None = None) -> ClientCredential
             "(STKAI_AUTH_CLIENT_ID, STKAI_AUTH_CLIENT_SECRET)."
         )
 
-    return ClientCredentialsAuthProvider(
-        client_id=config.client_id,  # type: ignore[arg-type]
-        client_secret=config.client_secret,  # type: ignore[arg-type]
-        token_url=config.token_url,
-    )
+    key = (config.client_id, config.client_secret, config.token_url)
+    with _PROVIDER_REGISTRY_LOCK:
+        provider = _PROVIDER_REGISTRY.get(key)  # type: ignore[arg-type]
+        if provider is None:
+            provider = ClientCredentialsAuthProvider(
+                client_id=config.client_id,  # type: ignore[arg-type]
+                client_secret=config.client_secret,  # type: ignore[arg-type]
+                token_url=config.token_url,
+            )
+            _PROVIDER_REGISTRY[key] = provider  # type: ignore[index]
+        return provider
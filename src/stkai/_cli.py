@@ -7,6 +7,40 @@ allowing the SDK to detect CLI mode and retrieve CLI-specific configuration.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
+# Host prefix of the CodeBuddy API and of the sibling APIs derived from it
+_CODEBUDDY_API_HOST_PREFIX = "genai-code-buddy-api"
+_INFERENCE_APP_HOST_PREFIX = "genai-inference-app"
+_DATA_INTEGRATION_HOST_PREFIX = "data-integration-api"
+
+
+# oscli is either installed or not for the lifetime of the process, so probing it once is enough.
+# Failed sanity checks raise instead of returning, and exceptions are never cached.
+@lru_cache(maxsize=1)
+def _is_oscli_available() -> bool:
+    try:
+        import oscli  # noqa: F401
+
+        return True
+    except ImportError:
+        return False
+
+
+@lru_cache(maxsize=1)
+def _get_oscli_codebuddy_base_url() -> str | None:
+    try:
+        from oscli import __codebuddy_base_url__
+
+        assert __codebuddy_base_url__, \
+            "🌀 Sanity check | __codebuddy_base_url__ must not be empty. This oscli version seems to be broken."
+        assert isinstance(__codebuddy_base_url__, str), \
+            "🌀 Sanity check | __codebuddy_base_url__ must be a string. This oscli version seems to be broken."
+
+        return __codebuddy_base_url__ if __codebuddy_base_url__ else None
+    except (ImportError, AttributeError):
+        return None
+
 
 class StkCLI:
     """
@@ -26,36 +60,25 @@ class StkCLI:
         """
         Check if StackSpot CLI (oscli) is available.
 
+        The result is cached for the lifetime of the process (see `_clear_cache()`).
+
         Returns:
             True if oscli can be imported (CLI mode), False otherwise.
         """
-        try:
-            import oscli  # noqa: F401
-
-            return True
-        except ImportError:
-            return False
+        return _is_oscli_available()
 
     @staticmethod
     def get_codebuddy_base_url() -> str | None:
         """
         Get CodeBuddy base URL from CLI if available.
 
+        The result is cached for the lifetime of the process (see `_clear_cache()`).
+
         Returns:
             The CLI's __codebuddy_base_url__ if oscli is installed
             and the attribute exists, None otherwise.
         """
-        try:
-            from oscli import __codebuddy_base_url__
-
-            assert __codebuddy_base_url__, \
-                "🌀 Sanity check | __codebuddy_base_url__ must not be empty. This oscli version seems to be broken."
-            assert isinstance(__codebuddy_base_url__, str), \
-                "🌀 Sanity check | __codebuddy_base_url__ must be a string. This oscli version seems to be broken."
-
-            return __codebuddy_base_url__ if __codebuddy_base_url__ else None
-        except (ImportError, AttributeError):
-            return None
+        return _get_oscli_codebuddy_base_url()
 
     @staticmethod
     def get_inference_app_base_url() -> str | None:
@@ -68,7 +91,7 @@ class StkCLI:
         """
         codebuddy_base_url = StkCLI.get_codebuddy_base_url()
         if codebuddy_base_url:
-            return codebuddy_base_url.replace("genai-code-buddy-api", "genai-inference-app")
+            return codebuddy_base_url.replace(_CODEBUDDY_API_HOST_PREFIX, _INFERENCE_APP_HOST_PREFIX)
         return None
 
     @staticmethod
@@ -82,5 +105,11 @@ class StkCLI:
         """
         codebuddy_base_url = StkCLI.get_codebuddy_base_url()
         if codebuddy_base_url:
-            return codebuddy_base_url.replace("genai-code-buddy-api", "data-integration-api")
+            return codebuddy_base_url.replace(_CODEBUDDY_API_HOST_PREFIX, _DATA_INTEGRATION_HOST_PREFIX)
         return None
+
+    @staticmethod
+    def _clear_cache() -> None:
+        """Forget the cached oscli probes, so the next calls re-check `sys.modules` (used by tests)."""
+        _is_oscli_available.cache_clear()
+        _get_oscli_codebuddy_base_url.cache_clear()
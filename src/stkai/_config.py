@@ -30,7 +30,7 @@ from __future__ import annotations
 import os
 from collections.abc import Callable
 from dataclasses import dataclass, field, fields, replace
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, Literal, Self
 
 # Type alias for rate limit strategies
@@ -81,6 +81,15 @@ class ConfigValidationError(ValueError):
 # =============================================================================
 
 
+# String values recognized when parsing booleans and "no limit" settings (compared lowercased)
+_TRUE_VALUES = frozenset({"true", "1", "yes"})
+_UNLIMITED_VALUES = frozenset({"none", "null", "unlimited"})
+
+
+def _parse_bool(value: str) -> bool:
+    return value.lower() in _TRUE_VALUES
+
+
 class EnvVars:
     """
     Utility class for reading environment variables with type conversion.
@@ -144,7 +153,7 @@ class EnvVars:
         if type_hint is float or type_str == "float":
             return float
         if type_hint is bool or type_str == "bool":
-            return lambda v: v.lower() in ("true", "1", "yes")
+            return _parse_bool
         # str and other types: return as string
         return str
 
@@ -154,7 +163,35 @@ class EnvVars:
 # =============================================================================
 
 
-@dataclass(frozen=True)
+# Config classes are fixed at import time, so their field names are collected once per class
+# (as a dict, to keep declaration order while allowing fast membership checks)
+_FIELD_NAMES_CACHE: dict[type, dict[str, None]] = {}
+
+
+def _field_names(config_type: type) -> dict[str, None]:
+    names = _FIELD_NAMES_CACHE.get(config_type)
+    if names is None:
+        names = _FIELD_NAMES_CACHE[config_type] = dict.fromkeys(f.name for f in fields(config_type))
+    return names
+
+
+# (field name, env var, type hint, converter) for each env-backed field, resolved once per class
+_EnvField = tuple[str, str, Any, Callable[[str], Any]]
+_ENV_FIELDS_CACHE: dict[type, tuple[_EnvField, ...]] = {}
+
+
+def _env_fields(config_type: type) -> tuple[_EnvField, ...]:
+    env_fields = _ENV_FIELDS_CACHE.get(config_type)
+    if env_fields is None:
+        env_fields = _ENV_FIELDS_CACHE[config_type] = tuple(
+            (f.name, f.metadata["env"], f.type, f.metadata.get("converter") or EnvVars._infer_converter(f.type))
+            for f in fields(config_type)
+            if f.metadata.get("env") and not f.metadata.get("skip", False)
+        )
+    return env_fields
+
+
+@dataclass(frozen=True, slots=True)
 class OverridableConfig:
     """
     Base class for immutable configuration dataclasses.
@@ -197,19 +234,32 @@ class OverridableConfig:
         if not overrides:
             return self
 
-        valid_fields = {f.name for f in fields(self)}
-        invalid_fields = set(overrides.keys()) - valid_fields
+        valid_fields = _field_names(type(self))
+        invalid_fields = {name for name in overrides if name not in valid_fields}
 
         if invalid_fields:
             raise ValueError(
                 f"Unknown config fields: {invalid_fields}. "
-                f"Valid fields are: {valid_fields}"
+                f"Valid fields are: {set(valid_fields)}"
             )
 
         allow_none = allow_none_fields or set()
         filtered = {k: v for k, v in overrides.items() if v is not None or k in allow_none}
         return replace(self, **filtered) if filtered else self
 
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Return the config fields as a plain dict.
+
+        Unlike `dataclasses.asdict()`, values are not deep-copied (config values
+        are immutable), so this is cheap enough to call on every configure.
+
+        Example:
+            >>> preset = RateLimitConfig.balanced_preset(max_requests=50)
+            >>> STKAI.configure(rate_limit=preset.to_dict())
+        """
+        return {name: getattr(self, name) for name in _field_names(type(self))}
+
     def with_env_vars(self) -> Self:
         """
         Return new instance with environment variables applied.
@@ -221,17 +271,10 @@ class OverridableConfig:
             ConfigEnvVarError: If an env var has an invalid value.
         """
         overrides: dict[str, Any] = {}
-        for f in fields(self):
-            env_var = f.metadata.get("env")
-            skip = f.metadata.get("skip", False)
-            if env_var and not skip:
-                value = EnvVars.get(
-                    var_name=env_var,
-                    type_hint=f.type,
-                    converter=f.metadata.get("converter"),
-                )
-                if value is not None:
-                    overrides[f.name] = value
+        for name, env_var, type_hint, converter in _env_fields(type(self)):
+            value = EnvVars.get(var_name=env_var, type_hint=type_hint, converter=converter)
+            if value is not None:
+                overrides[name] = value
         return self.with_overrides(overrides)
 
 
@@ -240,7 +283,7 @@ class OverridableConfig:
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SdkConfig:
     """
     SDK metadata (read-only, not configurable).
@@ -280,7 +323,7 @@ class SdkConfig:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuthConfig(OverridableConfig):
     """
     Authentication configuration for StackSpot AI.
@@ -332,7 +375,7 @@ class AuthConfig(OverridableConfig):
         return self
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RqcConfig(OverridableConfig):
     """
     Configuration for RemoteQuickCommand clients.
@@ -363,7 +406,8 @@ class RqcConfig(OverridableConfig):
             Env var: STKAI_RQC_POLL_MAX_DURATION
 
         poll_overload_timeout: Maximum seconds to tolerate CREATED status before
-            assuming server overload.
+            assuming server overload. Polling slows down (up to 2x the interval)
+            as this limit is approached.
             Env var: STKAI_RQC_POLL_OVERLOAD_TIMEOUT
 
         max_workers: Maximum number of concurrent threads for execute_many().
@@ -372,6 +416,15 @@ class RqcConfig(OverridableConfig):
         base_url: Base URL for the RQC API. If None, uses StackSpot CLI.
             Env var: STKAI_RQC_BASE_URL
 
+        poll_backoff_factor: Multiplier applied to the polling interval after each
+            non-terminal status check (exponential backoff). Use 1.0 for a fixed interval.
+            Example: with 2s interval and factor 2.0, polls wait 2s, 4s, 8s... up to poll_max_interval.
+            Env var: STKAI_RQC_POLL_BACKOFF_FACTOR
+
+        poll_max_interval: Upper bound in seconds for the backed-off polling interval.
+            Never lowers the interval below poll_interval.
+            Env var: STKAI_RQC_POLL_MAX_INTERVAL
+
     Example:
         >>> from stkai import STKAI
         >>> STKAI.config.rqc.request_timeout
@@ -388,6 +441,8 @@ class RqcConfig(OverridableConfig):
     poll_overload_timeout: float = field(default=60.0, metadata={"env": "STKAI_RQC_POLL_OVERLOAD_TIMEOUT"})
     max_workers: int = field(default=8, metadata={"env": "STKAI_RQC_MAX_WORKERS"})
     base_url: str = field(default="https://genai-code-buddy-api.stackspot.com", metadata={"env": "STKAI_RQC_BASE_URL"})
+    poll_backoff_factor: float = field(default=1.0, metadata={"env": "STKAI_RQC_POLL_BACKOFF_FACTOR"})
+    poll_max_interval: float = field(default=60.0, metadata={"env": "STKAI_RQC_POLL_MAX_INTERVAL"})
 
     def validate(self) -> Self:
         """Validate RQC configuration fields."""
@@ -411,6 +466,16 @@ class RqcConfig(OverridableConfig):
                 "poll_interval", self.poll_interval,
                 "Must be greater than 0.", section="rqc"
             )
+        if self.poll_backoff_factor < 1.0:
+            raise ConfigValidationError(
+                "poll_backoff_factor", self.poll_backoff_factor,
+                "Must be >= 1.0.", section="rqc"
+            )
+        if self.poll_max_interval <= 0:
+            raise ConfigValidationError(
+                "poll_max_interval", self.poll_max_interval,
+                "Must be greater than 0.", section="rqc"
+            )
         if self.poll_max_duration <= 0:
             raise ConfigValidationError(
                 "poll_max_duration", self.poll_max_duration,
@@ -434,7 +499,7 @@ class RqcConfig(OverridableConfig):
         return self
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AgentConfig(OverridableConfig):
     """
     Configuration for Agent clients.
@@ -508,7 +573,7 @@ class AgentConfig(OverridableConfig):
         return self
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileUploadConfig(OverridableConfig):
     """
     Configuration for FileUploader clients.
@@ -588,7 +653,7 @@ class FileUploadConfig(OverridableConfig):
         return self
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RateLimitConfig(OverridableConfig):
     """
     Configuration for HTTP client rate limiting.
@@ -693,26 +758,26 @@ class RateLimitConfig(OverridableConfig):
         if not overrides:
             return self
 
-        # Convert "unlimited"/"none"/"null" strings to None for max_wait_time
-        processed = dict(overrides)
-        if "max_wait_time" in processed:
-            value = processed["max_wait_time"]
-            if isinstance(value, str) and value.lower() in ("none", "null", "unlimited"):
-                processed["max_wait_time"] = None
+        # Convert "unlimited"/"none"/"null" strings to None for max_wait_time (copying only when needed)
+        processed = overrides
+        value = overrides.get("max_wait_time")
+        if isinstance(value, str) and value.lower() in _UNLIMITED_VALUES:
+            processed = {**overrides, "max_wait_time": None}
 
-        # Always allow None for max_wait_time, plus any additional fields
+        # Always allow None for max_wait_time, plus any additional fields.
+        # Explicit super() args: slots=True rebuilds the class, which breaks the zero-arg form
         merged_allow_none = {"max_wait_time"} | (allow_none_fields or set())
-        return super().with_overrides(processed, allow_none_fields=merged_allow_none)
+        return super(RateLimitConfig, self).with_overrides(processed, allow_none_fields=merged_allow_none)
 
     def with_env_vars(self) -> Self:
         """Override to handle max_wait_time (can be None for 'unlimited')."""
-        # Process normal fields via base class
-        result = super().with_env_vars()
+        # Process normal fields via base class (explicit super() args, see with_overrides)
+        result = super(RateLimitConfig, self).with_env_vars()
 
         # Process max_wait_time manually
         overrides: dict[str, Any] = {}
         if max_wait := os.environ.get("STKAI_RATE_LIMIT_MAX_WAIT_TIME"):
-            if max_wait.lower() in ("none", "null", "unlimited"):
+            if max_wait.lower() in _UNLIMITED_VALUES:
                 overrides["max_wait_time"] = None
             else:
                 overrides["max_wait_time"] = float(max_wait)
@@ -762,8 +827,10 @@ class RateLimitConfig(OverridableConfig):
     # -------------------------------------------------------------------------
     # Presets
     # -------------------------------------------------------------------------
+    # Presets are frozen, so one instance per (max_requests, time_window) is shared by all callers.
 
     @classmethod
+    @lru_cache(maxsize=16)
     def conservative_preset(
         cls,
         max_requests: int = 20,
@@ -811,6 +878,7 @@ class RateLimitConfig(OverridableConfig):
         )
 
     @classmethod
+    @lru_cache(maxsize=16)
     def balanced_preset(
         cls,
         max_requests: int = 40,
@@ -858,6 +926,7 @@ class RateLimitConfig(OverridableConfig):
         )
 
     @classmethod
+    @lru_cache(maxsize=16)
     def optimistic_preset(
         cls,
         max_requests: int = 80,
@@ -905,7 +974,7 @@ class RateLimitConfig(OverridableConfig):
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConfigEntry:
     """
     A configuration field with its resolved value and source.
@@ -980,7 +1049,7 @@ class ConfigEntry:
         return str_value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class STKAIConfigTracker:
     """
     Tracks the source of config field values.
@@ -1172,7 +1241,7 @@ class STKAIConfigTracker:
         return {section: dict(flds) for section, flds in self.sources.items()}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class STKAIConfig:
     """
     Global configuration for the stkai SDK.
@@ -1363,6 +1432,26 @@ class STKAIConfig:
 # Global Configuration Singleton
 # =============================================================================
 
+# Defaults + env vars, keyed by the STKAI_* env snapshot and CLI mode they were built from.
+# Configs are immutable, so resets share them instead of re-parsing unchanged env vars.
+_ENV_CONFIG_CACHE: dict[tuple[frozenset[tuple[str, str]], bool], STKAIConfig] = {}
+_ENV_CONFIG_CACHE_MAX_SIZE = 32
+
+
+def _env_config() -> STKAIConfig:
+    """Return defaults + env vars (`STKAIConfig().with_env_vars()`), reusing a cached build."""
+    from stkai._cli import StkCLI
+
+    env_snapshot = frozenset((k, v) for k, v in os.environ.items() if k.startswith("STKAI_"))
+    key = (env_snapshot, StkCLI.is_available())
+    config = _ENV_CONFIG_CACHE.get(key)
+    if config is None:
+        config = STKAIConfig().with_env_vars()
+        if len(_ENV_CONFIG_CACHE) >= _ENV_CONFIG_CACHE_MAX_SIZE:
+            _ENV_CONFIG_CACHE.clear()
+        _ENV_CONFIG_CACHE[key] = config
+    return config
+
 
 class _STKAI:
     """
@@ -1380,7 +1469,7 @@ class _STKAI:
 
     def __init__(self) -> None:
         """Initialize with defaults, environment variables, and CLI values."""
-        self._config: STKAIConfig = STKAIConfig().with_env_vars().with_cli_defaults()
+        self._config: STKAIConfig = _env_config().with_cli_defaults()
 
     def configure(
         self,
@@ -1436,9 +1525,7 @@ class _STKAI:
             ... )
         """
         # Start with defaults, apply env vars and CLI values as base layer
-        base = STKAIConfig()
-        if allow_env_override:
-            base = base.with_env_vars()  # defaults + env vars
+        base = _env_config() if allow_env_override else STKAIConfig()  # defaults (+ env vars)
         if allow_cli_override:
             base = base.with_cli_defaults()  # CLI values take precedence over env vars
 
@@ -1485,7 +1572,7 @@ class _STKAI:
             >>> from stkai import STKAI
             >>> STKAI.reset()
         """
-        self._config = STKAIConfig().with_env_vars().with_cli_defaults()
+        self._config = _env_config().with_cli_defaults()
         return self.validate()
 
     def validate(self) -> STKAIConfig:
@@ -291,7 +291,9 @@ class StandaloneHttpClient(HttpClient):
     HTTP client using AuthProvider for standalone authentication.
 
     This client uses an AuthProvider to obtain authorization tokens,
-    enabling standalone operation without the StackSpot CLI.
+    enabling standalone operation without the StackSpot CLI. Requests go
+    through a single `requests.Session`, so connections (and their TLS
+    handshakes) are pooled and reused across calls and threads.
 
     Use this client when:
     - You want to run without the StackSpot CLI dependency
@@ -333,6 +335,7 @@ class StandaloneHttpClient(HttpClient):
         assert isinstance(auth_provider, AuthProvider), "auth_provider must be an AuthProvider instance"
 
         self._auth = auth_provider
+        self._session = requests.Session()
 
     @override
     def get(
@@ -363,7 +366,7 @@ class StandaloneHttpClient(HttpClient):
 
         merged_headers = {**self._auth.get_auth_headers(), **(headers or {})}
 
-        return requests.get(
+        return self._session.get(
             url,
             headers=merged_headers,
             timeout=timeout,
@@ -400,7 +403,7 @@ class StandaloneHttpClient(HttpClient):
 
         merged_headers = {**self._auth.get_auth_headers(), **(headers or {})}
 
-        return requests.post(
+        return self._session.post(
             url,
             json=data,
             headers=merged_headers,
@@ -433,7 +436,7 @@ class StandaloneHttpClient(HttpClient):
 
         merged_headers = {**self._auth.get_auth_headers(), **(headers or {})}
 
-        return requests.post(
+        return self._session.post(
             url,
             json=data,
             headers=merged_headers,
@@ -323,9 +323,13 @@ class TokenBucketRateLimitedHttpClient(HttpClient):
         self.time_window = time_window
         self.max_wait_time = max_wait_time
 
-        # Token bucket state
-        self._tokens = float(max_requests)
-        self._last_refill = time.monotonic()
+        # Token bucket state, in integer nanosecond units: one token is worth
+        # `_time_window_ns` units and refill adds `max_requests` units per elapsed ns,
+        # so refill and consumption are exact (no float drift)
+        self._time_window_ns = max(1, round(time_window * 1_000_000_000))
+        self._capacity = max_requests * self._time_window_ns
+        self._tokens = self._capacity
+        self._last_refill_ns = time.monotonic_ns()
         self._lock = threading.Lock()
 
     def _acquire_token(self) -> None:
@@ -334,36 +338,37 @@ class TokenBucketRateLimitedHttpClient(HttpClient):
 
         Uses Token Bucket algorithm:
         - Refills tokens based on elapsed time
-        - Waits if no tokens are available
+        - Waits if no tokens are available, sleeping once for the exact time
+          until the next token refills (no polling)
         - Raises TokenAcquisitionTimeoutError if max_wait_time is exceeded
 
         Raises:
             TokenAcquisitionTimeoutError: If waiting exceeds max_wait_time.
         """
-        start_time = time.monotonic()
+        start_ns = time.monotonic_ns()
 
         while True:
             with self._lock:
-                now = time.monotonic()
+                now_ns = time.monotonic_ns()
                 # Refill tokens based on elapsed time
-                elapsed_since_refill = now - self._last_refill
-                refill_rate = self.max_requests / self.time_window
+                elapsed_ns = now_ns - self._last_refill_ns
                 self._tokens = min(
-                    float(self.max_requests),
-                    self._tokens + elapsed_since_refill * refill_rate
+                    self._capacity,
+                    self._tokens + elapsed_ns * self.max_requests
                 )
-                self._last_refill = now
+                self._last_refill_ns = now_ns
 
-                if self._tokens >= 1.0:
-                    self._tokens -= 1.0
+                if self._tokens >= self._time_window_ns:
+                    self._tokens -= self._time_window_ns
                     return
 
-                # Calculate wait time for next token
-                wait_time = (1.0 - self._tokens) / refill_rate
+                # Calculate wait time for next token (ceiling division, in ns)
+                wait_ns = -(-(self._time_window_ns - self._tokens) // self.max_requests)
+                wait_time = wait_ns / 1_000_000_000
 
             # Check timeout before sleeping
             if self.max_wait_time is not None:
-                total_waited = time.monotonic() - start_time
+                total_waited = (time.monotonic_ns() - start_ns) / 1_000_000_000
                 if total_waited + wait_time > self.max_wait_time:
                     raise TokenAcquisitionTimeoutError(
                         waited=total_waited,
@@ -622,9 +627,12 @@ class AdaptiveRateLimitedHttpClient(HttpClient):
             )
             # Clamp tokens to maintain invariant: tokens <= effective_max
             self._tokens = min(self._tokens, self._effective_max)
-            logger.warning(
-                f"Rate limit adapted: effective_max reduced from {old_max:.1f} to {self._effective_max:.1f}"
-            )
+            new_max = self._effective_max
+
+        # Log outside the lock: handlers may do I/O and must not stall other threads
+        logger.warning(
+            f"Rate limit adapted: effective_max reduced from {old_max:.1f} to {new_max:.1f}"
+        )
 
     @override
     def get(
@@ -870,6 +878,7 @@ class CongestionAwareHttpClient(HttpClient):
         Args:
             latency: Request latency in seconds.
         """
+        now = time.monotonic()
         with self._lock:
             # Update latency EMA
             if self._latency_ema is None:
@@ -881,7 +890,6 @@ class CongestionAwareHttpClient(HttpClient):
                 )
 
             # Update throughput estimate (sliding window)
-            now = time.monotonic()
             self._request_count += 1
             elapsed = now - self._throughput_window_start
 
@@ -24,15 +24,18 @@ import logging
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
 from copy import deepcopy
-from dataclasses import dataclass, replace
+from dataclasses import dataclass
 from typing import Any, override
 
 from stkai.rqc._models import RqcRequest
 
 logger = logging.getLogger(__name__)
 
+_NON_STRING_RESULT_ERROR = "{execution_id} | RQC | Cannot parse JSON from non-string result (type={type_name})"
+"""Message template for the TypeError raised by JsonResultHandler; only formatted on the error path."""
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class RqcResultContext:
     """
     Context passed to result handlers during processing.
@@ -59,7 +62,8 @@ class RqcResultContext:
 
     def with_result(self, result: Any) -> "RqcResultContext":
         """Returns a new context with the given result and handled=True."""
-        return replace(self, raw_result=result, handled=True)
+        # Built directly (rather than via `dataclasses.replace`) since chains call it once per handler
+        return RqcResultContext(self.request, result, self.execution_id, True)
 
 
 class RqcResultHandlerError(RuntimeError):
@@ -109,6 +113,21 @@ class RqcResultHandler(ABC):
         """
         pass
 
+    def handle_results(self, contexts: Sequence[RqcResultContext]) -> list[Any]:
+        """
+        Process a batch of results and return the transformed values.
+
+        The default implementation calls `handle_result()` for each context.
+        Override it when a handler can process many results more efficiently at once.
+
+        Args:
+            contexts: The RqcResultContext objects to process.
+
+        Returns:
+            The transformed result values, in the same order as `contexts`.
+        """
+        return [self.handle_result(context) for context in contexts]
+
 
 class ChainedResultHandler(RqcResultHandler):
     """
@@ -156,13 +175,51 @@ class ChainedResultHandler(RqcResultHandler):
                     result_handler=next_handler,
                     message=f"Handler '{handler_name}' failed in chain: {e}",
                 ) from e
-            # Only advance context on success; on error the exception propagates
-            context = context.with_result(result)
+            # Only advance context on success (and if another handler will read it);
+            # on error the exception propagates
+            if i + 1 < total:
+                context = context.with_result(result)
             logger.debug(
                 f"{context.execution_id} | RQC | Handler '{handler_name}' completed ({i + 1}/{total})"
             )
         return result
 
+    @override
+    def handle_results(self, contexts: Sequence[RqcResultContext]) -> list[Any]:
+        """
+        Executes each handler over the whole batch before moving to the next one.
+
+        Each handler receives all contexts at once via its own `handle_results()`,
+        so handlers with batch-aware implementations can amortize their per-call costs.
+        """
+        total = len(self.chained_handlers)
+        logger.debug(
+            f"{'RQC-Batch-Handling'[:26]:<26} | RQC | Processing chain with {total} handler(s) over {len(contexts)} result(s)"
+        )
+
+        results = [context.raw_result for context in contexts]
+        for i, next_handler in enumerate(self.chained_handlers):
+            handler_name = next_handler.__class__.__name__
+            try:
+                results = next_handler.handle_results(contexts)
+            except RqcResultHandlerError:
+                raise
+            except Exception as e:
+                raise RqcResultHandlerError(
+                    cause=e,
+                    result_handler=next_handler,
+                    message=f"Handler '{handler_name}' failed in chain: {e}",
+                ) from e
+            assert len(results) == len(contexts), (
+                f"🌀 Sanity check | Handler '{handler_name}' returned {len(results)} result(s) for {len(contexts)} context(s)."
+            )
+            # Only advance contexts on success; on error the exception propagates
+            contexts = [context.with_result(result) for context, result in zip(contexts, results, strict=True)]
+            logger.debug(
+                f"{'RQC-Batch-Handling'[:26]:<26} | RQC | Handler '{handler_name}' completed ({i + 1}/{total})"
+            )
+        return results
+
     @staticmethod
     def of(handlers: RqcResultHandler | Sequence[RqcResultHandler]) -> "ChainedResultHandler":
         """
@@ -232,6 +289,7 @@ class JsonResultHandler(RqcResultHandler):
             - '{"ok": true}' -> {'ok': True}
             - '```json\\n{"x":1}\\n```' -> {'x': 1}
         """
+        # Fast path: empty results (None, "") skip type dispatch, sanitizing and parsing
         result = context.raw_result
         if not result:
             return result
@@ -240,9 +298,8 @@ class JsonResultHandler(RqcResultHandler):
             return deepcopy(result)
 
         if not isinstance(result, str):
-            _type_name = type(result).__name__
             raise TypeError(
-                f"{context.execution_id} | RQC | Cannot parse JSON from non-string result (type={_type_name})"
+                _NON_STRING_RESULT_ERROR.format(execution_id=context.execution_id, type_name=type(result).__name__)
             )
 
         # Remove Markdown code block wrappers (```json ... ```)
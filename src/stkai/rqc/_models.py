@@ -65,12 +65,7 @@ class RqcExecutionStatus(enum.StrEnum):
         if not value:
             return None
 
-        try:
-            status = cls(value.upper())
-        except ValueError:
-            return None
-
-        return status if status in (cls.CREATED, cls.RUNNING, cls.COMPLETED, cls.FAILURE) else None
+        return _SERVER_STATUSES.get(value.upper())
 
     @classmethod
     def from_exception(cls, exc: Exception) -> "RqcExecutionStatus":
@@ -94,6 +89,20 @@ class RqcExecutionStatus(enum.StrEnum):
         return cls.TIMEOUT if is_timeout_exception(exc) else cls.ERROR
 
 
+# Module-level aliases for the statuses, so hot-path checks skip the enum class attribute lookup
+_PENDING = RqcExecutionStatus.PENDING
+_CREATED = RqcExecutionStatus.CREATED
+_RUNNING = RqcExecutionStatus.RUNNING
+_COMPLETED = RqcExecutionStatus.COMPLETED
+_FAILURE = RqcExecutionStatus.FAILURE
+_ERROR = RqcExecutionStatus.ERROR
+_TIMEOUT = RqcExecutionStatus.TIMEOUT
+
+# Statuses accepted from the server, keyed by their (upper-case) wire value
+_SERVER_STATUSES: dict[str, RqcExecutionStatus] = {
+    status.value: status for status in (_CREATED, _RUNNING, _COMPLETED, _FAILURE)
+}
+
 _VALID_TRANSITIONS: dict[RqcExecutionStatus, frozenset[RqcExecutionStatus]] = {
     RqcExecutionStatus.PENDING:   frozenset({RqcExecutionStatus.CREATED, RqcExecutionStatus.ERROR, RqcExecutionStatus.TIMEOUT}),
     RqcExecutionStatus.CREATED:   frozenset({RqcExecutionStatus.RUNNING, RqcExecutionStatus.COMPLETED, RqcExecutionStatus.FAILURE, RqcExecutionStatus.ERROR, RqcExecutionStatus.TIMEOUT}),
@@ -104,8 +113,16 @@ _VALID_TRANSITIONS: dict[RqcExecutionStatus, frozenset[RqcExecutionStatus]] = {
     RqcExecutionStatus.TIMEOUT:   frozenset(),
 }
 
+# Bitmask form of _VALID_TRANSITIONS (one bit per status, by declaration order),
+# so `transition_to` checks validity with a single AND instead of a frozenset lookup
+_STATUS_BITS: dict[RqcExecutionStatus, int] = {status: 1 << i for i, status in enumerate(RqcExecutionStatus)}
+_VALID_TRANSITION_MASKS: dict[RqcExecutionStatus, int] = {
+    source: sum(_STATUS_BITS[target] for target in targets)
+    for source, targets in _VALID_TRANSITIONS.items()
+}
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RqcRequest:
     """
     Represents a Remote QuickCommand request.
@@ -167,12 +184,13 @@ class RqcRequest:
         return target_file
 
 
-@dataclass
+@dataclass(slots=True)
 class RqcExecution:
     """Internal: tracks lifecycle of a single RQC execution."""
     request: RqcRequest
     _execution_id: str | None = field(default=None, init=False)
     _submitted_at: float | None = field(default=None, init=False)
+    _submitted_at_monotonic: float | None = field(default=None, init=False)
     _status: RqcExecutionStatus = field(default=RqcExecutionStatus.PENDING, init=False)
     _error: str | None = field(default=None, init=False)
 
@@ -200,7 +218,7 @@ class RqcExecution:
 
     def is_created(self) -> bool:
         """Returns True if the execution was successfully created on the server."""
-        return self._status == RqcExecutionStatus.CREATED
+        return self._status == _CREATED
 
     def mark_as_submitted(self, execution_id: str) -> None:
         """
@@ -212,12 +230,22 @@ class RqcExecution:
         assert execution_id, "Execution ID received from StackSpot AI server can not be empty."
         self._execution_id = execution_id
         self._submitted_at = time.time()
+        self._submitted_at_monotonic = time.monotonic()
 
-    def elapsed_since_submitted(self) -> float:
-        """Returns seconds elapsed since submission, or 0.0 if not yet submitted."""
-        if self._submitted_at is None:
+    def elapsed_since_submitted(self, now: float | None = None) -> float:
+        """
+        Returns seconds elapsed since submission, or 0.0 if not yet submitted.
+
+        Args:
+            now: Optional `time.monotonic()` reading to measure against, so callers
+                that already read the clock don't need a second read.
+        """
+        if self._submitted_at_monotonic is None:
             return 0.0
-        return time.time() - self._submitted_at
+        if now is None:
+            now = time.monotonic()
+        # Monotonic clock: wall-clock adjustments (e.g. NTP) must not skew the overload timeout
+        return now - self._submitted_at_monotonic
 
     def transition_to(self, new_status: RqcExecutionStatus, error: str | None = None) -> None:
         """
@@ -232,11 +260,11 @@ class RqcExecution:
         if new_status == self._status:
             return
 
-        allowed = _VALID_TRANSITIONS.get(self._status, frozenset())
-        if new_status not in allowed:
+        if not _VALID_TRANSITION_MASKS.get(self._status, 0) & _STATUS_BITS[new_status]:
+            # Lazy %-style args: the message is only formatted if a handler accepts WARNING records
             logger.warning(
-                f"{self._execution_id or self.request.id} | RQC | "
-                f"⚠️ Unexpected status transition: {self._status} → {new_status}"
+                "%s | RQC | ⚠️ Unexpected status transition: %s → %s",
+                self._execution_id or self.request.id, self._status, new_status,
             )
         self._status = new_status
         if error is not None:
@@ -253,17 +281,11 @@ class RqcExecution:
         Returns:
             An RqcResponse reflecting the current execution state.
         """
-        return RqcResponse(
-            request=self.request,
-            status=self._status,
-            result=result,
-            error=self._error,
-            raw_response=raw_response,
-            execution_id=self._execution_id,
-        )
+        # Positional, in RqcResponse field order: request, status, result, error, raw_response, execution_id
+        return RqcResponse(self.request, self._status, result, self._error, raw_response, self._execution_id)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RqcResponse:
     """
     Represents the full Remote QuickCommand response.
@@ -311,31 +333,31 @@ class RqcResponse:
 
     def is_pending(self) -> bool:
         """Returns True if the request has not been submitted yet."""
-        return self.status == RqcExecutionStatus.PENDING
+        return self.status == _PENDING
 
     def is_created(self) -> bool:
         """Returns True if the execution was created but not yet running."""
-        return self.status == RqcExecutionStatus.CREATED
+        return self.status == _CREATED
 
     def is_running(self) -> bool:
         """Returns True if the execution is currently being processed."""
-        return self.status == RqcExecutionStatus.RUNNING
+        return self.status == _RUNNING
 
     def is_completed(self) -> bool:
         """Returns True if the execution completed successfully."""
-        return self.status == RqcExecutionStatus.COMPLETED
+        return self.status == _COMPLETED
 
     def is_failure(self) -> bool:
         """Returns True if the execution failed on the server-side."""
-        return self.status == RqcExecutionStatus.FAILURE
+        return self.status == _FAILURE
 
     def is_error(self) -> bool:
         """Returns True if a client-side error occurred during execution."""
-        return self.status == RqcExecutionStatus.ERROR
+        return self.status == _ERROR
 
     def is_timeout(self) -> bool:
         """Returns True if the execution timed out waiting for completion."""
-        return self.status == RqcExecutionStatus.TIMEOUT
+        return self.status == _TIMEOUT
 
     def error_with_details(self) -> dict[str, Any]:
         """Returns a dictionary with error details for non-completed responses."""
@@ -8,6 +8,7 @@ with built-in polling, retries, and thread-based concurrency.
 import json
 import logging
 import time
+import uuid
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
@@ -30,7 +31,7 @@ logger = logging.getLogger(__name__)
 # Options
 # ======================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreateExecutionOptions:
     """
     Options for the create-execution phase.
@@ -51,7 +52,7 @@ class CreateExecutionOptions:
     request_timeout: int | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetResultOptions:
     """
     Options for the get-result (polling) phase.
@@ -63,15 +64,21 @@ class GetResultOptions:
         poll_interval: Seconds to wait between polling status checks.
         poll_max_duration: Maximum seconds to wait before timing out.
         poll_overload_timeout: Maximum seconds to tolerate CREATED status before assuming server overload.
+            While in CREATED, the polling interval is stretched in proportion to the time spent queued.
         request_timeout: HTTP request timeout in seconds.
+        poll_backoff_factor: Multiplier applied to the polling interval after each non-terminal
+            status check (exponential backoff). Use 1.0 for a fixed interval.
+        poll_max_interval: Upper bound in seconds for the backed-off polling interval.
     """
     poll_interval: float | None = None
     poll_max_duration: float | None = None
     poll_overload_timeout: float | None = None
     request_timeout: int | None = None
+    poll_backoff_factor: float | None = None
+    poll_max_interval: float | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RqcOptions:
     """
     Consolidated configuration options for RemoteQuickCommand.
@@ -128,6 +135,8 @@ class RqcOptions:
             ),
             get_result=GetResultOptions(
                 poll_interval=gr.poll_interval if gr.poll_interval is not None else cfg.poll_interval,
+                poll_backoff_factor=gr.poll_backoff_factor if gr.poll_backoff_factor is not None else cfg.poll_backoff_factor,
+                poll_max_interval=gr.poll_max_interval if gr.poll_max_interval is not None else cfg.poll_max_interval,
                 poll_max_duration=gr.poll_max_duration if gr.poll_max_duration is not None else cfg.poll_max_duration,
                 poll_overload_timeout=gr.poll_overload_timeout if gr.poll_overload_timeout is not None else cfg.poll_overload_timeout,
                 request_timeout=gr.request_timeout if gr.request_timeout is not None else cfg.request_timeout,
@@ -563,36 +572,58 @@ class RemoteQuickCommand:
         opts = self.options.get_result
         assert opts is not None, "get_result options must be set after with_defaults_from()"
         assert opts.poll_interval is not None, "poll_interval must be set after with_defaults_from()"
+        assert opts.poll_backoff_factor is not None, "poll_backoff_factor must be set after with_defaults_from()"
+        assert opts.poll_max_interval is not None, "poll_max_interval must be set after with_defaults_from()"
         assert opts.poll_max_duration is not None, "poll_max_duration must be set after with_defaults_from()"
         assert opts.poll_overload_timeout is not None, "poll_overload_timeout must be set after with_defaults_from()"
         assert opts.request_timeout is not None, "request_timeout must be set after with_defaults_from()"
 
-        start_time = time.time()
+        # Monotonic deadline computed once; each tick only compares the clock against it
+        deadline = time.monotonic() + opts.poll_max_duration
         execution_id = execution.execution_id
 
+        # Polling interval grows by poll_backoff_factor after each sleep, capped at poll_max_interval
+        # (never below poll_interval); a factor of 1.0 keeps it fixed
+        poll_interval = opts.poll_interval
+        poll_backoff_factor = opts.poll_backoff_factor
+        max_poll_interval = max(opts.poll_max_interval, opts.poll_interval)
+
+        def sleep_before_next_poll(stretch: float = 1.0) -> None:
+            nonlocal poll_interval
+            # Never sleep past the poll max-duration deadline
+            remaining = deadline - time.monotonic()
+            delay = min(poll_interval * stretch, max_poll_interval)
+            sleep_with_jitter(max(0.0, min(delay, remaining)))
+            poll_interval = min(poll_interval * poll_backoff_factor, max_poll_interval)
+
+        # Built once per execution; only the nocache query param changes between polls
+        poll_url = f"{self.base_url}/v1/quick-commands/callback/{execution_id}"
+        nocache_headers = {
+            "Cache-Control": "no-cache, no-store",
+            "Pragma": "no-cache",
+        }
+
         logger.info(f"{execution_id} | RQC | Starting polling loop...")
 
         try:
+            # Polls right away and only sleeps after a non-terminal response, so fast executions
+            # are picked up without waiting a full poll interval
             while True:
+                # One clock read per tick, shared by the max-duration and overload checks
+                now = time.monotonic()
                 # Gives up after poll max-duration (it prevents infinite loop)
-                if time.time() - start_time > opts.poll_max_duration:
+                if now >= deadline:
                     raise TimeoutError(
                         f"Timeout after {opts.poll_max_duration} seconds waiting for RQC execution to complete. "
                         f"Last status: `{execution.status}`."
                     )
 
                 try:
-                    # Build full URL using base_url and prevents client-side caching
-                    import uuid
-                    nocache_param = str(uuid.uuid4())
-                    url = f"{self.base_url}/v1/quick-commands/callback/{execution_id}?nocache={nocache_param}"
-                    nocache_headers = {
-                        "Cache-Control": "no-cache, no-store",
-                        "Pragma": "no-cache",
-                    }
-
+                    # A fresh query param on every poll prevents client-side caching
                     response = self.http_client.get(
-                        url=url, headers=nocache_headers, timeout=opts.request_timeout
+                        url=f"{poll_url}?nocache={uuid.uuid4()}",
+                        headers=nocache_headers,
+                        timeout=opts.request_timeout,
                     )
                     assert isinstance(response, requests.Response), \
                         f"🌀 Sanity check | Object returned by `get` method is not an instance of `requests.Response`. ({response.__class__})"
@@ -608,7 +639,7 @@ class RemoteQuickCommand:
                     logger.warning(
                         f"{execution_id} | RQC | ⚠️ Temporary polling failure: {e}"
                     )
-                    sleep_with_jitter(opts.poll_interval)
+                    sleep_before_next_poll()
                     continue
 
                 raw_status = response_data.get('progress', {}).get('status')
@@ -617,16 +648,17 @@ class RemoteQuickCommand:
                     logger.warning(
                         f"{execution_id} | RQC | ⚠️ Unknown server status: '{raw_status}', continuing to poll..."
                     )
-                    sleep_with_jitter(opts.poll_interval)
+                    sleep_before_next_poll()
                     continue
 
-                if status != execution.status:
+                # from_server() returns enum members, so identity checks avoid StrEnum's str.__eq__
+                if status is not execution.status:
                     logger.info(f"{execution_id} | RQC | Current status: {status}")
                     self._transition_and_notify(
                         execution=execution, new_status=status, context=context
                     )
 
-                if status == RqcExecutionStatus.COMPLETED:
+                if status is RqcExecutionStatus.COMPLETED:
                     try:
                         logger.info(f"{execution_id} | RQC | Processing the execution result...")
                         raw_result = response_data.get("result")
@@ -653,16 +685,16 @@ class RemoteQuickCommand:
                             ),
                         ) from e
 
-                elif status == RqcExecutionStatus.FAILURE:
+                elif status is RqcExecutionStatus.FAILURE:
                     logger.error(
                         f"{execution_id} | RQC | ❌ Execution failed on the server-side with the following response: "
                         f"\n{json.dumps(response_data, indent=2)}"
                     )
                     return execution.to_response(raw_response=response_data)
 
-                elif status == RqcExecutionStatus.CREATED:
+                elif status is RqcExecutionStatus.CREATED:
                     # Track how long we've been in CREATED status (possible server overload)
-                    elapsed_in_created = execution.elapsed_since_submitted()
+                    elapsed_in_created = execution.elapsed_since_submitted(now=now)
                     if elapsed_in_created > opts.poll_overload_timeout:
                         raise TimeoutError(
                             f"Execution stuck in CREATED status for {elapsed_in_created:.2f}s. "
@@ -673,12 +705,13 @@ class RemoteQuickCommand:
                         f"{execution_id} | RQC | ⚠️ Execution is still in CREATED status "
                         f"({elapsed_in_created:.2f}s/{opts.poll_overload_timeout}s). Possible server overload..."
                     )
-                    sleep_with_jitter(opts.poll_interval)
+                    # The longer the execution sits in the server queue, the slower we poll (up to 2x)
+                    sleep_before_next_poll(stretch=1 + elapsed_in_created / opts.poll_overload_timeout)
                 else:
                     logger.info(
-                        f"{execution_id} | RQC | Execution is still running. Retrying in {int(opts.poll_interval)} seconds..."
+                        f"{execution_id} | RQC | Execution is still running. Retrying in {int(poll_interval)} seconds..."
                     )
-                    sleep_with_jitter(opts.poll_interval)
+                    sleep_before_next_poll()
 
         except Exception as e:
             # Catch-all for TimeoutError, HTTPError 4xx, RqcResultHandlerError, etc.
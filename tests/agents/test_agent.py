@@ -630,6 +630,8 @@ class FailThenSucceedHttpClient(HttpClient):
         self.failure_status_code = failure_status_code
         self.success_data = success_data or {"message": "Success"}
         self.call_count = 0
+        # Response table built once: fail_count failures followed by the success response
+        self._responses = [self._failure_response()] * fail_count + [self._success_response()]
 
     def get(
         self,
@@ -637,7 +639,7 @@ class FailThenSucceedHttpClient(HttpClient):
         headers: dict[str, str] | None = None,
         timeout: int = 30,
     ) -> requests.Response:
-        return self._make_response()
+        return self._next_response()
 
     def post(
         self,
@@ -646,24 +648,28 @@ class FailThenSucceedHttpClient(HttpClient):
         headers: dict[str, str] | None = None,
         timeout: int = 30,
     ) -> requests.Response:
-        return self._make_response()
+        return self._next_response()
 
-    def _make_response(self) -> requests.Response:
+    def _next_response(self) -> requests.Response:
+        response = self._responses[min(self.call_count, self.fail_count)]
         self.call_count += 1
-        response = MagicMock(spec=requests.Response)
+        return response
 
-        if self.call_count <= self.fail_count:
-            response.status_code = self.failure_status_code
-            response.json.return_value = {"error": "Server error"}
-            response.text = "Server error"
-            error = requests.HTTPError(response=response)
-            response.raise_for_status.side_effect = error
-        else:
-            response.status_code = 200
-            response.json.return_value = self.success_data
-            response.text = str(self.success_data)
-            response.raise_for_status.return_value = None
+    def _failure_response(self) -> requests.Response:
+        response = MagicMock(spec=requests.Response)
+        response.status_code = self.failure_status_code
+        response.json.return_value = {"error": "Server error"}
+        response.text = "Server error"
+        error = requests.HTTPError(response=response)
+        response.raise_for_status.side_effect = error
+        return response
 
+    def _success_response(self) -> requests.Response:
+        response = MagicMock(spec=requests.Response)
+        response.status_code = 200
+        response.json.return_value = self.success_data
+        response.text = str(self.success_data)
+        response.raise_for_status.return_value = None
         return response
 
 
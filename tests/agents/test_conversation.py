@@ -1,7 +1,9 @@
 """Tests for UseConversation context manager and ConversationContext."""
 
+import atexit
 import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from unittest.mock import MagicMock
 
@@ -17,6 +19,10 @@ from stkai.agents import (
 )
 from stkai.agents._conversation import ConversationScope
 
+# Shared thread pool for concurrency tests (avoids spawning new threads per test)
+_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="test-conversation")
+atexit.register(_EXECUTOR.shutdown)
+
 
 class MockHttpClient(HttpClient):
     """Mock HTTP client that records payloads and returns configurable responses."""
@@ -188,14 +194,7 @@ class TestConversationContext(unittest.TestCase):
             ctx.update_if_absent(value)
             results.append(ctx.conversation_id)
 
-        threads = [
-            threading.Thread(target=updater, args=(f"conv-{i}",))
-            for i in range(10)
-        ]
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        list(_EXECUTOR.map(updater, [f"conv-{i}" for i in range(10)]))
 
         # All threads should see the same final value
         self.assertIsNotNone(ctx.conversation_id)
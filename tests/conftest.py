@@ -0,0 +1,28 @@
+"""Shared pytest configuration."""
+
+import pytest
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="run tests marked as slow (real sleeps/threads)"
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test: use --runslow to run it")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(autouse=True)
+def clear_stk_cli_cache():
+    """Tests patch `sys.modules["oscli"]`, so the cached oscli probes must not leak between them."""
+    from stkai._cli import StkCLI
+
+    StkCLI._clear_cache()
+    yield
+    StkCLI._clear_cache()
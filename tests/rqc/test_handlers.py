@@ -2,13 +2,15 @@
 
 import json
 import unittest
+from collections.abc import Sequence
 from typing import Any
-from unittest.mock import Mock
+from unittest.mock import patch
 
 from stkai.rqc import (
     RqcRequest,
     RqcResultContext,
     RqcResultHandler,
+    RqcResultHandlerError,
 )
 from stkai.rqc._handlers import (
     DEFAULT_RESULT_HANDLER,
@@ -92,6 +94,14 @@ class TestJsonResultHandler(unittest.TestCase):
         result = self.handler.handle_result(context)
         self.assertEqual("", result)
 
+    def test_empty_result_skips_json_parsing(self):
+        """Should return empty results without reaching the JSON parser."""
+        with patch("stkai.rqc._handlers.json.loads") as mock_parse:
+            self.assertIsNone(self.handler.handle_result(make_context(raw_result=None)))
+            self.assertEqual("", self.handler.handle_result(make_context(raw_result="")))
+
+        mock_parse.assert_not_called()
+
     def test_parses_json_string_to_dict(self):
         """Should parse valid JSON string into Python dict."""
         context = make_context(raw_result='{"name": "test", "value": 123}')
@@ -173,6 +183,20 @@ class TestJsonResultHandler(unittest.TestCase):
         with self.assertRaises(json.JSONDecodeError):
             self.handler.handle_result(context)
 
+    def test_returns_independent_copies_for_repeated_json_string(self):
+        """Should return equal but independent objects when parsing the same JSON string twice."""
+        json_str = '{"key": {"nested": "value"}}'
+        first = self.handler.handle_result(make_context(raw_result=json_str))
+        second = self.handler.handle_result(make_context(raw_result=json_str))
+
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
+        # Modifying one result should not leak into subsequent parses
+        first["key"]["nested"] = "modified"
+        third = self.handler.handle_result(make_context(raw_result=json_str))
+        self.assertEqual(third, {"key": {"nested": "value"}})
+
     def test_default_result_handler_is_json_handler(self):
         """DEFAULT_RESULT_HANDLER constant should be a JsonResultHandler instance."""
         self.assertIsInstance(DEFAULT_RESULT_HANDLER, JsonResultHandler)
@@ -181,14 +205,19 @@ class TestJsonResultHandler(unittest.TestCase):
 class TestJsonResultHandlerChainWith(unittest.TestCase):
     """Tests for JsonResultHandler.chain_with() static method."""
 
+    class _FakeHandler(RqcResultHandler):
+        def handle_result(self, context: RqcResultContext) -> Any:
+            return "transformed"
+
     def test_chain_with_creates_chained_handler(self):
         """Should create a ChainedResultHandler with JSON handler first."""
-        other_handler = Mock(spec=RqcResultHandler)
-        other_handler.handle_result.return_value = "transformed"
+        other_handler = self._FakeHandler()
 
         chained = JsonResultHandler.chain_with(other_handler)
 
         self.assertIsInstance(chained, ChainedResultHandler)
+        self.assertIsInstance(chained.chained_handlers[0], JsonResultHandler)
+        self.assertIs(chained.chained_handlers[1], other_handler)
 
     def test_chain_with_parses_json_then_applies_other_handler(self):
         """Should parse JSON first, then apply the other handler."""
@@ -279,6 +308,80 @@ class TestChainedResultHandler(unittest.TestCase):
         self.assertEqual(result, "original")
 
 
+class TestChainedResultHandlerBatch(unittest.TestCase):
+    """Tests for ChainedResultHandler.handle_results() batch method."""
+
+    def test_handle_results_processes_each_context_through_the_chain(self):
+        """Should run the whole chain over every context, preserving order."""
+        class ExtractFieldHandler(RqcResultHandler):
+            def handle_result(self, context: RqcResultContext) -> Any:
+                return context.raw_result.get("data")
+
+        handler = ChainedResultHandler([JsonResultHandler(), ExtractFieldHandler()])
+        contexts = [
+            make_context(raw_result='{"data": "first"}'),
+            make_context(raw_result='{"data": "second"}'),
+            make_context(raw_result='{"data": "third"}'),
+        ]
+
+        results = handler.handle_results(contexts)
+
+        self.assertEqual(results, ["first", "second", "third"])
+
+    def test_handle_results_uses_batch_implementation_of_each_handler(self):
+        """Should call each handler's handle_results() once with the whole batch."""
+        batch_sizes = []
+
+        class BatchAwareHandler(RqcResultHandler):
+            def handle_result(self, context: RqcResultContext) -> Any:
+                raise AssertionError("handle_result() should not be called in batch mode")
+
+            def handle_results(self, contexts: Sequence[RqcResultContext]) -> list[Any]:
+                batch_sizes.append(len(contexts))
+                return [c.raw_result * 2 for c in contexts]
+
+        handler = ChainedResultHandler([BatchAwareHandler(), BatchAwareHandler()])
+        contexts = [make_context(raw_result=1), make_context(raw_result=2)]
+
+        results = handler.handle_results(contexts)
+
+        self.assertEqual(results, [4, 8])
+        self.assertEqual(batch_sizes, [2, 2])
+
+    def test_handle_results_updates_handled_flag_after_first_handler(self):
+        """Should set handled=True in contexts after the first handler processes them."""
+        handled_flags = []
+
+        class TrackingHandler(RqcResultHandler):
+            def handle_result(self, ctx: RqcResultContext) -> Any:
+                handled_flags.append(ctx.handled)
+                return ctx.raw_result
+
+        handler = ChainedResultHandler([TrackingHandler(), TrackingHandler()])
+        contexts = [make_context(raw_result="a"), make_context(raw_result="b")]
+
+        handler.handle_results(contexts)
+
+        self.assertEqual(handled_flags, [False, False, True, True])
+
+    def test_handle_results_wraps_handler_errors(self):
+        """Should wrap handler exceptions in RqcResultHandlerError."""
+        handler = ChainedResultHandler([JsonResultHandler()])
+        contexts = [make_context(raw_result='{"ok": true}'), make_context(raw_result="not json")]
+
+        with self.assertRaises(RqcResultHandlerError) as ctx:
+            handler.handle_results(contexts)
+
+        self.assertIsInstance(ctx.exception.cause, json.JSONDecodeError)
+        self.assertIsInstance(ctx.exception.result_handler, JsonResultHandler)
+
+    def test_handle_results_with_empty_batch_returns_empty_list(self):
+        """Should return an empty list when there are no contexts."""
+        handler = ChainedResultHandler([JsonResultHandler()])
+
+        self.assertEqual(handler.handle_results([]), [])
+
+
 class TestChainedResultHandlerOf(unittest.TestCase):
     """Tests for ChainedResultHandler.of() factory method."""
 
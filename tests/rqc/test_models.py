@@ -2,8 +2,11 @@
 
 import logging
 import unittest
+from unittest.mock import patch
 
 from stkai.rqc._models import (
+    _STATUS_BITS,
+    _VALID_TRANSITION_MASKS,
     _VALID_TRANSITIONS,
     RqcExecution,
     RqcExecutionStatus,
@@ -102,14 +105,27 @@ class TestValidTransitions(unittest.TestCase):
         for status in RqcExecutionStatus:
             self.assertIn(status, _VALID_TRANSITIONS, f"Status {status} is not covered in _VALID_TRANSITIONS")
 
+    def test_masks_match_transition_sets(self):
+        """_VALID_TRANSITION_MASKS (used by transition_to) should encode exactly the _VALID_TRANSITIONS sets."""
+        for source, targets in _VALID_TRANSITIONS.items():
+            for target in RqcExecutionStatus:
+                self.assertEqual(
+                    bool(_VALID_TRANSITION_MASKS[source] & _STATUS_BITS[target]), target in targets,
+                    f"Mask mismatch for transition {source} → {target}"
+                )
+
 
 class TestRqcExecution(unittest.TestCase):
     """Tests for RqcExecution lifecycle tracker."""
 
+    @classmethod
+    def setUpClass(cls):
+        # Shared across tests: RqcRequest is frozen, so no test can mutate it
+        cls.request = RqcRequest(payload={"x": 1})
+
     def test_initial_state_is_pending(self):
         """New execution should start in PENDING status."""
-        request = RqcRequest(payload={"x": 1})
-        execution = RqcExecution(request=request)
+        execution = RqcExecution(request=self.request)
 
         self.assertEqual(execution.status, RqcExecutionStatus.PENDING)
         self.assertIsNone(execution.execution_id)
@@ -117,26 +133,38 @@ class TestRqcExecution(unittest.TestCase):
 
     def test_mark_as_submitted_sets_execution_id_and_timestamp(self):
         """mark_as_submitted should set execution_id and submitted_at."""
-        request = RqcRequest(payload={"x": 1})
-        execution = RqcExecution(request=request)
+        execution = RqcExecution(request=self.request)
 
         execution.mark_as_submitted("exec-123")
 
         self.assertEqual(execution.execution_id, "exec-123")
         self.assertIsNotNone(execution.submitted_at)
 
+    def test_elapsed_since_submitted_uses_monotonic_clock(self):
+        """elapsed_since_submitted should measure with the monotonic clock, not wall-clock time."""
+        execution = RqcExecution(request=self.request)
+
+        with patch("stkai.rqc._models.time.monotonic", side_effect=[100.0, 102.5]), \
+                patch("stkai.rqc._models.time.time", side_effect=[5000.0, 1000.0]):
+            execution.mark_as_submitted("exec-123")
+            self.assertEqual(execution.elapsed_since_submitted(), 2.5)
+
+    def test_elapsed_since_submitted_is_zero_before_submission(self):
+        """elapsed_since_submitted should return 0.0 before the execution is submitted."""
+        execution = RqcExecution(request=self.request)
+
+        self.assertEqual(execution.elapsed_since_submitted(), 0.0)
+
     def test_mark_as_submitted_fails_with_empty_id(self):
         """mark_as_submitted should fail with empty execution_id."""
-        request = RqcRequest(payload={"x": 1})
-        execution = RqcExecution(request=request)
+        execution = RqcExecution(request=self.request)
 
         with self.assertRaises(AssertionError):
             execution.mark_as_submitted("")
 
     def test_valid_transition(self):
         """transition_to should work for valid transitions."""
-        request = RqcRequest(payload={"x": 1})
-        execution = RqcExecution(request=request)
+        execution = RqcExecution(request=self.request)
 
         execution.transition_to(RqcExecutionStatus.CREATED)
         self.assertEqual(execution.status, RqcExecutionStatus.CREATED)
@@ -149,22 +177,20 @@ class TestRqcExecution(unittest.TestCase):
 
     def test_unexpected_transition_logs_warning_but_updates(self):
         """Unexpected transitions should log a warning but still update status."""
-        request = RqcRequest(payload={"x": 1})
-        execution = RqcExecution(request=request)
+        execution = RqcExecution(request=self.request)
 
         # PENDING → COMPLETED is not in valid transitions
         with self.assertLogs("stkai.rqc._models", level="WARNING") as cm:
             execution.transition_to(RqcExecutionStatus.COMPLETED)
 
         self.assertEqual(execution.status, RqcExecutionStatus.COMPLETED)
-        self.assertIn("Unexpected status transition", cm.output[0])
-        self.assertIn("PENDING", cm.output[0])
-        self.assertIn("COMPLETED", cm.output[0])
+        self.assertIn(
+            f"{self.request.id} | RQC | ⚠️ Unexpected status transition: PENDING → COMPLETED", cm.output[0]
+        )
 
     def test_same_status_transition_is_noop(self):
         """Transitioning to the same status should be a no-op (no warning, no error change)."""
-        request = RqcRequest(payload={"x": 1})
-        execution = RqcExecution(request=request)
+        execution = RqcExecution(request=self.request)
         execution.transition_to(RqcExecutionStatus.CREATED)
         execution.transition_to(RqcExecutionStatus.RUNNING)
         execution.transition_to(RqcExecutionStatus.ERROR, error="original error")
@@ -181,8 +207,7 @@ class TestRqcExecution(unittest.TestCase):
 
     def test_transition_from_terminal_state_logs_warning(self):
         """Transitioning from a terminal state should log a warning."""
-        request = RqcRequest(payload={"x": 1})
-        execution = RqcExecution(request=request)
+        execution = RqcExecution(request=self.request)
         execution.transition_to(RqcExecutionStatus.CREATED)
         execution.transition_to(RqcExecutionStatus.COMPLETED)
 
@@ -195,15 +220,13 @@ class TestRqcExecution(unittest.TestCase):
 
     def test_error_is_none_initially(self):
         """New execution should have no error."""
-        request = RqcRequest(payload={"x": 1})
-        execution = RqcExecution(request=request)
+        execution = RqcExecution(request=self.request)
 
         self.assertIsNone(execution.error)
 
     def test_transition_to_with_error_sets_error(self):
         """transition_to with error parameter should set the error message."""
-        request = RqcRequest(payload={"x": 1})
-        execution = RqcExecution(request=request)
+        execution = RqcExecution(request=self.request)
 
         execution.transition_to(RqcExecutionStatus.ERROR, error="Something went wrong")
 
@@ -212,8 +235,7 @@ class TestRqcExecution(unittest.TestCase):
 
     def test_transition_to_without_error_preserves_existing_error(self):
         """transition_to without error should not clear an existing error."""
-        request = RqcRequest(payload={"x": 1})
-        execution = RqcExecution(request=request)
+        execution = RqcExecution(request=self.request)
         execution.transition_to(RqcExecutionStatus.ERROR, error="First error")
 
         # Transition without error should preserve the existing one
@@ -224,8 +246,7 @@ class TestRqcExecution(unittest.TestCase):
 
     def test_transition_to_with_error_overwrites_previous_error(self):
         """transition_to with a new error should overwrite the previous one."""
-        request = RqcRequest(payload={"x": 1})
-        execution = RqcExecution(request=request)
+        execution = RqcExecution(request=self.request)
         execution.transition_to(RqcExecutionStatus.ERROR, error="First error")
 
         with self.assertLogs("stkai.rqc._models", level="WARNING"):
@@ -237,10 +258,14 @@ class TestRqcExecution(unittest.TestCase):
 class TestRqcExecutionToResponse(unittest.TestCase):
     """Tests for RqcExecution.to_response() method."""
 
+    @classmethod
+    def setUpClass(cls):
+        # Shared across tests: RqcRequest is frozen, so no test can mutate it
+        cls.request = RqcRequest(payload={"x": 1})
+
     def test_to_response_for_completed_status(self):
         """to_response should create a COMPLETED response with result and raw_response."""
-        request = RqcRequest(payload={"x": 1})
-        execution = RqcExecution(request=request)
+        execution = RqcExecution(request=self.request)
         execution.mark_as_submitted("exec-123")
         execution.transition_to(RqcExecutionStatus.CREATED)
         execution.transition_to(RqcExecutionStatus.COMPLETED)
@@ -251,7 +276,7 @@ class TestRqcExecutionToResponse(unittest.TestCase):
         )
 
         self.assertIsInstance(response, RqcResponse)
-        self.assertIs(response.request, request)
+        self.assertIs(response.request, self.request)
         self.assertEqual(response.status, RqcExecutionStatus.COMPLETED)
         self.assertEqual(response.result, {"answer": "42"})
         self.assertIsNone(response.error)
@@ -260,8 +285,7 @@ class TestRqcExecutionToResponse(unittest.TestCase):
 
     def test_to_response_for_error_status(self):
         """to_response should create an ERROR response with error message."""
-        request = RqcRequest(payload={"x": 1})
-        execution = RqcExecution(request=request)
+        execution = RqcExecution(request=self.request)
         execution.transition_to(RqcExecutionStatus.ERROR, error="Connection refused")
 
         response = execution.to_response()
@@ -274,8 +298,7 @@ class TestRqcExecutionToResponse(unittest.TestCase):
 
     def test_to_response_for_failure_with_raw_response(self):
         """to_response should include raw_response for FAILURE status."""
-        request = RqcRequest(payload={"x": 1})
-        execution = RqcExecution(request=request)
+        execution = RqcExecution(request=self.request)
         execution.mark_as_submitted("exec-456")
         execution.transition_to(RqcExecutionStatus.CREATED)
         execution.transition_to(
@@ -293,8 +316,7 @@ class TestRqcExecutionToResponse(unittest.TestCase):
 
     def test_to_response_for_timeout_status(self):
         """to_response should create a TIMEOUT response with error message."""
-        request = RqcRequest(payload={"x": 1})
-        execution = RqcExecution(request=request)
+        execution = RqcExecution(request=self.request)
         execution.mark_as_submitted("exec-789")
         execution.transition_to(RqcExecutionStatus.CREATED)
         execution.transition_to(RqcExecutionStatus.RUNNING)
@@ -308,8 +330,7 @@ class TestRqcExecutionToResponse(unittest.TestCase):
 
     def test_to_response_for_pending_status(self):
         """to_response should work for PENDING (initial) status."""
-        request = RqcRequest(payload={"x": 1})
-        execution = RqcExecution(request=request)
+        execution = RqcExecution(request=self.request)
 
         response = execution.to_response()
 
@@ -2,11 +2,15 @@
 
 import json
 import logging
-import tempfile
-import time
+import math
+import re
+import threading
 import unittest
-from pathlib import Path
-from unittest.mock import Mock
+from collections import Counter
+from dataclasses import dataclass, field
+from itertools import chain, repeat
+from typing import Any
+from unittest.mock import Mock, patch
 
 import requests
 
@@ -20,39 +24,109 @@ from stkai.rqc import (
     RqcRequest,
 )
 
+# Extracts the execution_id from a polling URL: .../callback/{execution_id}?nocache=...
+EXECUTION_ID_PATTERN = re.compile(r"/callback/(exec-\d+)")
+
 # ======================
 # Helper functions
 # ======================
 
+@dataclass(frozen=True, slots=True)
+class FakeResponse(requests.Response):
+    """Lightweight stand-in for requests.Response exposing only what RQC reads."""
+    json_data: Any = None
+    status_code: int = 200
+    text: str = ""
+    error: requests.HTTPError | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Built once per fake, so polling the same response re-raises the same instance
+        if 400 <= self.status_code < 600:
+            kind = "Client" if self.status_code < 500 else "Server"
+            object.__setattr__(self, "error", requests.HTTPError(f"{self.status_code} {kind} Error", response=self))
+
+    def json(self, **kwargs: Any) -> Any:
+        return self.json_data
+
+    def raise_for_status(self) -> None:
+        if self.error is not None:
+            raise self.error
+
+
 def make_response(json_data, status_code=200):
-    """Creates a mock that behaves like requests.Response"""
-    resp = Mock(spec=requests.Response)
-    resp.status_code = status_code
-    resp.json.return_value = json_data
-    resp.raise_for_status.side_effect = None
-    if 400 <= status_code < 500:
-        err = requests.HTTPError(f"{status_code} Client Error")
-        err.response = resp
-        resp.raise_for_status.side_effect = err
-    elif 500 <= status_code < 600:
-        err = requests.HTTPError(f"{status_code} Server Error")
-        err.response = resp
-        resp.raise_for_status.side_effect = err
-    return resp
+    """Creates a fake that behaves like requests.Response"""
+    return FakeResponse(json_data=json_data, status_code=status_code)
+
+
+# Canned responses shared across tests; fakes are frozen, so reusing them is safe
+RESP_401 = make_response(json_data={}, status_code=401)
+RESP_403 = make_response(json_data={}, status_code=403)
+RESP_503 = make_response(json_data={}, status_code=503)
+RESP_EMPTY_OK = make_response(json_data={})
+
+# Canned polling payloads; RQC only reads them, so tests can share (and merge from) the same dicts
+RUNNING_PAYLOAD = {"progress": {"status": "RUNNING"}}
+COMPLETED_PAYLOAD = {"progress": {"status": "COMPLETED"}}
+FAILURE_PAYLOAD = {"progress": {"status": "FAILURE"}, "result": None}
+CREATED_PAYLOAD = {"progress": {"status": "CREATED"}, "result": None}
+PENDING_PAYLOAD = {"progress": {"status": "PENDING"}}
+
+RESP_COMPLETED = make_response(json_data=COMPLETED_PAYLOAD)
+RESP_FAILURE = make_response(json_data=FAILURE_PAYLOAD)
+RESP_PENDING = make_response(json_data=PENDING_PAYLOAD)
+
+
+class FakeClock:
+    """
+    Deterministic monotonic clock for polling and retry tests.
+
+    Sleeping advances the clock instantly, so timeouts are reached without burning real time.
+    """
+
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float, *args, **kwargs) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class PerThreadFakeClock(FakeClock):
+    """
+    FakeClock whose time advances independently in each thread.
+
+    Concurrent executions (e.g. `execute_many`) each poll on their own timeline, so one
+    execution sleeping towards its deadline never expires the deadline of another.
+    """
+
+    def __init__(self, start: float = 1000.0):
+        super().__init__(start)
+        self._local = threading.local()
+
+    def monotonic(self) -> float:
+        return getattr(self._local, "now", self.now)
+
+    def sleep(self, seconds: float, *args, **kwargs) -> None:
+        self.sleeps.append(seconds)
+        self._local.now = self.monotonic() + seconds
 
 
 class TestRemoteQuickCommandExecute(unittest.TestCase):
 
-    def setUp(self):
-        self.tmp_dir = Path(tempfile.mkdtemp())
-        self.slug_name = "test-slug"
+    @classmethod
+    def setUpClass(cls):
+        cls.slug_name = "test-slug"
 
         # Mock of the client respecting the interface signature
-        self.http_client = Mock(spec=HttpClient)
+        cls.http_client = Mock(spec_set=HttpClient)
 
-        # Instance with small intervals to run fast
-        self.rqc = RemoteQuickCommand(
-            slug_name=self.slug_name,
+        # Instance with small intervals to run fast; shared by all tests, which only reset the mock
+        cls.rqc = RemoteQuickCommand(
+            slug_name=cls.slug_name,
             options=RqcOptions(
                 create_execution=CreateExecutionOptions(
                     retry_max_retries=3,
@@ -63,14 +137,36 @@ class TestRemoteQuickCommandExecute(unittest.TestCase):
                     poll_max_duration=0.1,
                 ),
             ),
-            http_client=self.http_client,
+            http_client=cls.http_client,
             listeners=[],  # Disable default FileLoggingListener
         )
 
+    @classmethod
+    def tearDownClass(cls):
+        cls.rqc.executor.shutdown(wait=True)
+
+    def setUp(self):
+        # Drops calls, canned responses and side effects left behind by the previous test
+        self.http_client.reset_mock(return_value=True, side_effect=True)
+
+    def use_fake_clock(self, clock: FakeClock | None = None) -> FakeClock:
+        """Patches the clock and sleeps used by polling and retries with a FakeClock until the test ends."""
+        clock = clock or FakeClock()
+        for target, replacement in (
+            ("stkai.rqc._remote_quick_command.time.monotonic", clock.monotonic),
+            ("stkai.rqc._remote_quick_command.sleep_with_jitter", clock.sleep),
+            ("stkai._retry.sleep_with_jitter", clock.sleep),
+        ):
+            patcher = patch(target, replacement)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        return clock
+
     # ---------------------------------------------------------
     # Scenario: Successful execution (status COMPLETED)
     # ---------------------------------------------------------
     def test_execute_when_successful_completed(self):
+        clock = self.use_fake_clock()
         # Scenario
         request = RqcRequest(payload={"x": 1})
         execution_id = "exec-123"
@@ -100,6 +196,9 @@ class TestRemoteQuickCommandExecute(unittest.TestCase):
         # Verify GET was called with URL containing execution_id
         get_call_args = self.http_client.get.call_args
         self.assertIn(execution_id, get_call_args.kwargs.get('url', ''))
+        # First poll happens right after creation; sleeps only follow non-terminal responses
+        self.http_client.get.assert_called_once()
+        self.assertEqual(clock.sleeps, [])
 
     # ---------------------------------------------------------
     # Scenario: Error when creating execution (raise in POST)
@@ -126,13 +225,8 @@ class TestRemoteQuickCommandExecute(unittest.TestCase):
         execution_id = "exec-456"
 
         post_resp = make_response(json_data=execution_id)
-        fail_resp = make_response(json_data={
-            "progress": {"status": "FAILURE"},
-            "result": None
-        })
-
         self.http_client.post.return_value = post_resp
-        self.http_client.get.return_value = fail_resp
+        self.http_client.get.return_value = RESP_FAILURE
 
         # Action
         response = self.rqc.execute(request)
@@ -147,24 +241,43 @@ class TestRemoteQuickCommandExecute(unittest.TestCase):
     # Scenario: Polling exceeds max duration (TIMEOUT)
     # ---------------------------------------------------------
     def test_execute_when_polling_times_out(self):
+        self.use_fake_clock()
         # Scenario
         request = RqcRequest(payload={"x": 1})
         execution_id = "exec-789"
 
         post_resp = make_response(json_data=execution_id)
-        running_resp = make_response(json_data={"progress": {"status": "RUNNING"}})
+        running_resp = make_response(json_data=RUNNING_PAYLOAD)
 
         self.http_client.post.return_value = post_resp
         self.http_client.get.return_value = running_resp
 
+        # Polling backs off exponentially (0.01s, 0.02s, 0.04s...) until poll_max_duration
+        poll_interval, poll_max_duration = 0.01, 0.1
+        rqc = RemoteQuickCommand(
+            slug_name=self.slug_name,
+            options=RqcOptions(
+                get_result=GetResultOptions(
+                    poll_interval=poll_interval,
+                    poll_backoff_factor=2.0,
+                    poll_max_duration=poll_max_duration,
+                ),
+            ),
+            http_client=self.http_client,
+            listeners=[],  # Disable default FileLoggingListener
+        )
+
         # Action
-        response = self.rqc.execute(request)
+        response = rqc.execute(request)
 
         # Validation
         self.assertEqual(response.status, RqcExecutionStatus.TIMEOUT)
         self.assertIn("Timeout after 0.1 seconds waiting for RQC execution to complete. Last status: `RUNNING`", response.error)
         self.http_client.post.assert_called_once()
+        # Backoff bounds the number of polls to roughly log2(max_duration / interval)
+        max_polls = math.ceil(math.log2(poll_max_duration / poll_interval)) + 2
         self.assertGreaterEqual(self.http_client.get.call_count, 1)
+        self.assertLessEqual(self.http_client.get.call_count, max_polls)
 
     # ---------------------------------------------------------
     # Scenario: Unexpected error during polling
@@ -191,15 +304,13 @@ class TestRemoteQuickCommandExecute(unittest.TestCase):
     # Scenario: Polling stuck on CREATED and hits timeout
     # ---------------------------------------------------------
     def test_execute_when_polling_fails_on_server_is_overloaded(self):
+        clock = self.use_fake_clock()
         # Scenario
         request = RqcRequest(payload={"job": "long-running"})
         execution_id = "exec-created-123"
 
         post_resp = make_response(json_data=execution_id)
-        created_resp = make_response(json_data={
-            "progress": {"status": "CREATED"},
-            "result": None
-        })
+        created_resp = make_response(json_data=CREATED_PAYLOAD)
 
         self.http_client.post.return_value = post_resp
         self.http_client.get.return_value = created_resp
@@ -214,6 +325,7 @@ class TestRemoteQuickCommandExecute(unittest.TestCase):
                 ),
                 get_result=GetResultOptions(
                     poll_interval=0.01,
+                    poll_backoff_factor=2.0,
                     poll_max_duration=1.0,
                     poll_overload_timeout=0.05,  # Short timeout to trigger overload detection
                 ),
@@ -230,8 +342,13 @@ class TestRemoteQuickCommandExecute(unittest.TestCase):
         self.assertIn("CREATED status", result.error)
         self.assertIn("overloaded", result.error)
         self.http_client.post.assert_called_once()
-        # Should have made multiple GET attempts before overload timeout
+        # Backed-off polls (0.01s, 0.02s, 0.04s...) reach the overload timeout within a few GETs
         self.assertGreaterEqual(self.http_client.get.call_count, 1)
+        self.assertLessEqual(self.http_client.get.call_count, 4)
+        # Polling slows down the longer the execution stays queued in CREATED
+        self.assertGreater(len(clock.sleeps), 1)
+        self.assertEqual(clock.sleeps, sorted(clock.sleeps))
+        self.assertGreater(clock.sleeps[-1], clock.sleeps[0])
 
     # ---------------------------------------------------------
     # Scenario 1: 4xx error when creating execution (POST)
@@ -239,8 +356,7 @@ class TestRemoteQuickCommandExecute(unittest.TestCase):
     def test_execute_when_create_execution_fails_on_4xx(self):
         # Scenario
         request = RqcRequest(payload={"job": "fail-create"})
-        error_response = make_response(json_data={}, status_code=401)
-        self.http_client.post.return_value = error_response
+        self.http_client.post.return_value = RESP_401
 
         # Action
         result = self.rqc.execute(request)
@@ -260,10 +376,8 @@ class TestRemoteQuickCommandExecute(unittest.TestCase):
         execution_id = "exec-1234"
 
         post_resp = make_response(json_data=execution_id)
-        poll_resp = make_response(json_data={}, status_code=403)
-
         self.http_client.post.return_value = post_resp
-        self.http_client.get.return_value = poll_resp
+        self.http_client.get.return_value = RESP_403
 
         # Action
         result = self.rqc.execute(request)
@@ -281,9 +395,7 @@ class TestRemoteQuickCommandExecute(unittest.TestCase):
         # Scenario
         request = RqcRequest(payload={"job": "missing-exec-id"})
         # Simulate OK response but without ID in body (e.g., {}, None, or empty string)
-        post_resp = make_response(json_data={})
-
-        self.http_client.post.return_value = post_resp
+        self.http_client.post.return_value = RESP_EMPTY_OK
 
         # Action
         result = self.rqc.execute(request)
@@ -301,6 +413,7 @@ class TestRemoteQuickCommandExecute(unittest.TestCase):
     # Scenario: all attempts to create execution fail (e.g., ConnectionError)
     # ---------------------------------------------------------
     def test_execute_when_create_execution_fails_on_max_retries_exceeded(self):
+        self.use_fake_clock()
         # Scenario
         request = RqcRequest(payload={"job": "network-fail"})
         # Simulate consecutive connection failures
@@ -324,14 +437,15 @@ class TestRemoteQuickCommandExecute(unittest.TestCase):
     # Scenario: Polling has temporary HTTP 503 failures and finishes with COMPLETED
     # ---------------------------------------------------------
     def test_execute_when_polling_succeeds_after_temporary_polling_http_503_failures(self):
+        self.use_fake_clock()
         # 1. POST (create execution) OK
         execution_id = "exec-503"
         post_resp = make_response(json_data=execution_id)
         self.http_client.post.return_value = post_resp
 
-        # 2. GET (polling): 503 -> 503 -> RUNNING -> COMPLETED
-        http_503_error = make_response(json_data={}, status_code=503)
-        running_resp = make_response(json_data={"progress": {"status": "RUNNING"}})
+        # 2. GET (polling): 503 (x2) -> RUNNING -> COMPLETED
+        num_http_503_failures = 2
+        running_resp = make_response(json_data=RUNNING_PAYLOAD)
         completed_resp = make_response(
             json_data={
                 "progress": {"status": "COMPLETED"},
@@ -339,12 +453,10 @@ class TestRemoteQuickCommandExecute(unittest.TestCase):
             }
         )
 
-        self.http_client.get.side_effect = [
-            http_503_error,
-            http_503_error,
-            running_resp,
-            completed_resp,
-        ]
+        self.http_client.get.side_effect = chain(
+            repeat(RESP_503, num_http_503_failures),
+            (running_resp, completed_resp),
+        )
 
         # 3. Execute
         request = RqcRequest(payload={"job": "resilient-http-503"})
@@ -353,9 +465,42 @@ class TestRemoteQuickCommandExecute(unittest.TestCase):
         # 4. Validate
         self.assertEqual(RqcExecutionStatus.COMPLETED, result.status)
         self.assertIn("success", str(result.result))
-        self.assertGreaterEqual(self.http_client.get.call_count, 4)
+        self.assertEqual(self.http_client.get.call_count, num_http_503_failures + 2)
         self.http_client.post.assert_called_once()
 
+    # ---------------------------------------------------------
+    # Scenario: polling interval grows by the backoff factor up to the cap
+    # ---------------------------------------------------------
+    def test_execute_when_polling_backs_off_up_to_max_interval(self):
+        # Scenario
+        self.http_client.post.return_value = make_response(json_data="exec-backoff")
+        running_resp = make_response(json_data=RUNNING_PAYLOAD)
+        completed_resp = make_response(
+            json_data={"progress": {"status": "COMPLETED"}, "result": {"ok": True}}
+        )
+        self.http_client.get.side_effect = [running_resp] * 4 + [completed_resp]
+
+        rqc = RemoteQuickCommand(
+            slug_name=self.slug_name,
+            options=RqcOptions(
+                get_result=GetResultOptions(
+                    poll_interval=1.0,
+                    poll_backoff_factor=2.0,
+                    poll_max_interval=3.0,
+                ),
+            ),
+            http_client=self.http_client,
+            listeners=[],
+        )
+
+        # Action
+        clock = self.use_fake_clock()
+        result = rqc.execute(RqcRequest(payload={"job": "backoff"}))
+
+        # Validation
+        self.assertEqual(RqcExecutionStatus.COMPLETED, result.status)
+        self.assertEqual(clock.sleeps, [1.0, 2.0, 3.0, 3.0])
+
     # ---------------------------------------------------------
     # Scenario: error in result handler during polling (status COMPLETED)
     # ---------------------------------------------------------
@@ -368,7 +513,7 @@ class TestRemoteQuickCommandExecute(unittest.TestCase):
         self.http_client.post.return_value = post_resp
 
         # Polling sequence: RUNNING -> COMPLETED (with result)
-        running_resp = make_response(json_data={"progress": {"status": "RUNNING"}})
+        running_resp = make_response(json_data=RUNNING_PAYLOAD)
         completed_resp = make_response(
             json_data={
                 "progress": {"status": "COMPLETED"},
@@ -448,6 +593,7 @@ class TestRemoteQuickCommandExecute(unittest.TestCase):
         self.assertEqual(self.http_client.get.call_count, 2)
 
     def test_execute_when_polling_encounters_unknown_status_until_timeout(self):
+        self.use_fake_clock()
         execution_id = "exec-unknown-timeout"
 
         post_resp = make_response(json_data=execution_id)
@@ -465,6 +611,29 @@ class TestRemoteQuickCommandExecute(unittest.TestCase):
         self.assertEqual(RqcExecutionStatus.TIMEOUT, result.status)
         self.assertGreaterEqual(self.http_client.get.call_count, 1)
 
+    def test_execute_times_out_when_clock_lands_exactly_on_deadline(self):
+        clock = self.use_fake_clock()
+        rqc = RemoteQuickCommand(
+            slug_name=self.slug_name,
+            options=RqcOptions(
+                get_result=GetResultOptions(poll_interval=1.0, poll_max_duration=2.0),
+            ),
+            http_client=self.http_client,
+            listeners=[],
+        )
+        self.http_client.post.return_value = make_response(json_data="exec-exact-deadline")
+        # More responses than polls: a loop that kept polling at the deadline would run out of them
+        self.http_client.get.side_effect = [
+            make_response(json_data={"progress": {"status": "PROCESSING"}, "result": None})
+        ] * 3
+
+        result = rqc.execute(request=RqcRequest(payload={"job": "exact-deadline"}))
+
+        # Polls at t=0 and t=1; the clock then reaches the deadline (t=2) exactly and polling stops
+        self.assertEqual(RqcExecutionStatus.TIMEOUT, result.status)
+        self.assertEqual(self.http_client.get.call_count, 2)
+        self.assertEqual(clock.sleeps, [1.0, 1.0])
+
     def test_execute_many_when_all_responses_are_completed(self):
         # Scenario: 10 requests that complete successfully in parallel
         num_requests = 10
@@ -473,23 +642,14 @@ class TestRemoteQuickCommandExecute(unittest.TestCase):
         def delayed_post(url, data=None, headers=None, timeout=30):
             # Extract request id from the data payload
             exec_id = f"exec-{data['input_data']['id']}"
-            # simulate small stagger to mimic network latency
-            time.sleep(0.01)
             return make_response(json_data=exec_id)
 
         # get should return COMPLETED for each execution_id
         def delayed_get(url, headers=None, timeout=30):
             # Extract execution_id from URL
-            # URL format: .../callback/{execution_id}?nocache=...
-            import re
-            match = re.search(r'/callback/(exec-\d+)', url)
+            match = EXECUTION_ID_PATTERN.search(url)
             execution_id = match.group(1) if match else "unknown"
-            # small sleep to allow concurrency effects
-            time.sleep(0.005)
-            return make_response(json_data={
-                "progress": {"status": "COMPLETED"},
-                "result": {"execution_id": execution_id}
-            })
+            return make_response(json_data={**COMPLETED_PAYLOAD, "result": {"execution_id": execution_id}})
 
         self.http_client.post.side_effect = delayed_post
         self.http_client.get.side_effect = delayed_get
@@ -527,6 +687,7 @@ class TestRemoteQuickCommandExecute(unittest.TestCase):
         self.assertEqual(len(requests_list), len(responses))
 
     def test_execute_many_with_exceptions_and_mixed_statuses(self):
+        self.use_fake_clock(PerThreadFakeClock())
         num_requests = 10
 
         # Definition of polling behavior types
@@ -544,28 +705,26 @@ class TestRemoteQuickCommandExecute(unittest.TestCase):
 
         def mock_get(url, headers=None, timeout=30):
             # Extract execution_id from URL
-            import re
-            match = re.search(r'/callback/(exec-\d+)', url)
+            match = EXECUTION_ID_PATTERN.search(url)
             execution_id = match.group(1) if match else "exec-0"
             req_id = int(execution_id.split("-")[1])
             behavior = behavior_by_id[req_id]
 
             if behavior == "TIMEOUT":
-                # Simulate long polling until poll_max_duration is reached
-                time.sleep(self.rqc.options.get_result.poll_max_duration + 0.1)
-                return make_response(json_data={"progress": {"status": "PENDING"}})
+                # Never leaves PENDING, so polling keeps sleeping (on the fake clock) until poll_max_duration
+                return RESP_PENDING
 
             elif behavior == "ERROR":
                 # Simulate 4xx server error
                 err = requests.HTTPError("HTTP 403 Forbidden")
-                err.response = make_response(json_data={}, status_code=403)
+                err.response = RESP_403
                 raise err
 
             elif behavior == "FAILURE":
-                return make_response(json_data={"progress": {"status": "FAILURE"}})
+                return RESP_FAILURE
 
             else:  # COMPLETED
-                return make_response(json_data={"progress": {"status": "COMPLETED"}})
+                return RESP_COMPLETED
 
         self.http_client.post.side_effect = mock_post
         self.http_client.get.side_effect = mock_get
@@ -585,13 +744,13 @@ class TestRemoteQuickCommandExecute(unittest.TestCase):
         for req, resp in zip(requests_list, results, strict=True):
             self.assertIs(resp.request, req)
 
-        # Validation 3: final statuses
-        statuses = [r.status for r in results]
+        # Validation 3: final statuses (counted in a single pass)
+        status_counts = Counter(r.status for r in results)
 
-        self.assertEqual(sum(s == RqcExecutionStatus.COMPLETED for s in statuses), 7)
-        self.assertEqual(sum(s == RqcExecutionStatus.FAILURE for s in statuses), 1)
-        self.assertEqual(sum(s == RqcExecutionStatus.TIMEOUT for s in statuses), 1)
-        self.assertEqual(sum(s == RqcExecutionStatus.ERROR for s in statuses), 1)
+        self.assertEqual(status_counts[RqcExecutionStatus.COMPLETED], 7)
+        self.assertEqual(status_counts[RqcExecutionStatus.FAILURE], 1)
+        self.assertEqual(status_counts[RqcExecutionStatus.TIMEOUT], 1)
+        self.assertEqual(status_counts[RqcExecutionStatus.ERROR], 1)
 
 
 class TestRqcOptionsWithDefaultsFrom(unittest.TestCase):
@@ -621,8 +780,20 @@ class TestRqcOptionsWithDefaultsFrom(unittest.TestCase):
         self.assertEqual(resolved.get_result.poll_interval, cfg.poll_interval)
         self.assertEqual(resolved.get_result.poll_max_duration, cfg.poll_max_duration)
         self.assertEqual(resolved.get_result.poll_overload_timeout, cfg.poll_overload_timeout)
+        self.assertEqual(resolved.get_result.poll_backoff_factor, cfg.poll_backoff_factor)
+        self.assertEqual(resolved.get_result.poll_max_interval, cfg.poll_max_interval)
         self.assertEqual(resolved.get_result.request_timeout, cfg.request_timeout)
 
+    def test_get_result_options_keeps_positional_field_order(self):
+        """Backoff fields are appended, so existing positional arguments keep their meaning."""
+        from stkai.rqc import GetResultOptions
+
+        options = GetResultOptions(5.0, 300.0)
+
+        self.assertEqual(options.poll_interval, 5.0)
+        self.assertEqual(options.poll_max_duration, 300.0)
+        self.assertIsNone(options.poll_backoff_factor)
+
     def test_with_defaults_from_preserves_user_values(self):
         """Should preserve user-provided values and only fill None values."""
         from stkai._config import STKAI
@@ -663,7 +834,7 @@ class TestRemoteQuickCommandBaseUrl(unittest.TestCase):
 
     def test_custom_base_url_is_used(self):
         """Should use custom base_url when provided."""
-        http_client = Mock(spec=HttpClient)
+        http_client = Mock(spec_set=HttpClient)
         http_client.post.return_value = make_response(json_data="exec-123")
         http_client.get.return_value = make_response(
             json_data={"progress": {"status": "COMPLETED"}, "result": "{}"}
@@ -688,7 +859,7 @@ class TestRemoteQuickCommandBaseUrl(unittest.TestCase):
 
         rqc = RemoteQuickCommand(
             slug_name="my-slug",
-            http_client=Mock(spec=HttpClient),
+            http_client=Mock(spec_set=HttpClient),
             listeners=[],
         )
 
@@ -699,7 +870,7 @@ class TestRemoteQuickCommandBaseUrl(unittest.TestCase):
         rqc = RemoteQuickCommand(
             slug_name="my-slug",
             base_url="https://custom.api.com/",
-            http_client=Mock(spec=HttpClient),
+            http_client=Mock(spec_set=HttpClient),
             listeners=[],
         )
 
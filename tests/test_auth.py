@@ -1,12 +1,21 @@
 """Tests for authentication module."""
 
+import atexit
+import io
+import json
 import threading
 import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import FrozenInstanceError
 from unittest.mock import Mock, patch
+from urllib.parse import parse_qs
 
 import requests
+from urllib3 import HTTPResponse
+from urllib3.connectionpool import HTTPConnectionPool
 
+from stkai import _auth
 from stkai._auth import (
     AuthenticationError,
     AuthProvider,
@@ -16,6 +25,25 @@ from stkai._auth import (
 )
 from stkai._config import STKAI
 
+# Shared thread pool for concurrency tests (avoids spawning new threads per test)
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="test-auth")
+atexit.register(_EXECUTOR.shutdown)
+
+
+# The requests.Response surface the provider touches (status_code is only set in __init__,
+# so it isn't visible on the class for a spec)
+_RESPONSE_ATTRIBUTES = ["status_code", "text", "json", "raise_for_status"]
+
+
+def make_token_response(json_data: dict, status_code: int = 200) -> Mock:
+    """Creates a fake token endpoint response; 4xx/5xx codes raise on raise_for_status()."""
+    response = Mock(spec_set=_RESPONSE_ATTRIBUTES)
+    response.status_code = status_code
+    response.json.return_value = json_data
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(response=response)
+    return response
+
 
 class TestTokenInfo(unittest.TestCase):
     """Tests for TokenInfo dataclass."""
@@ -26,6 +54,12 @@ class TestTokenInfo(unittest.TestCase):
         self.assertEqual(token.access_token, "test-token")
         self.assertEqual(token.expires_at, 1234567890.0)
 
+    def test_is_frozen(self):
+        """Should not allow mutating a token, so it can be shared across threads without a lock."""
+        token = TokenInfo(access_token="test-token", expires_at=1234567890.0)
+        with self.assertRaises(FrozenInstanceError):
+            token.access_token = "other-token"  # type: ignore[misc]
+
 
 class TestAuthenticationError(unittest.TestCase):
     """Tests for AuthenticationError exception."""
@@ -112,16 +146,10 @@ class TestClientCredentialsAuthProviderGetToken(unittest.TestCase):
             client_secret="test-secret",
         )
 
-    @patch("stkai._auth.requests.post")
+    @patch.object(_auth._SESSION, "post")
     def test_get_access_token_fetches_new_token(self, mock_post):
         """Should fetch new token on first call."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "access_token": "new-token",
-            "expires_in": 1199,
-        }
-        mock_response.raise_for_status = Mock()
-        mock_post.return_value = mock_response
+        mock_post.return_value = make_token_response({"access_token": "new-token", "expires_in": 1199})
 
         token = self.auth.get_access_token()
 
@@ -129,20 +157,16 @@ class TestClientCredentialsAuthProviderGetToken(unittest.TestCase):
         mock_post.assert_called_once()
         call_args = mock_post.call_args
         self.assertEqual(call_args[0][0], ClientCredentialsAuthProvider.DEFAULT_TOKEN_URL)
-        self.assertEqual(call_args[1]["data"]["grant_type"], "client_credentials")
-        self.assertEqual(call_args[1]["data"]["client_id"], "test-id")
-        self.assertEqual(call_args[1]["data"]["client_secret"], "test-secret")
+        # Form body is pre-encoded once per provider
+        form_data = parse_qs(call_args[1]["data"].decode("ascii"))
+        self.assertIn(b"grant_type=client_credentials", call_args[1]["data"])
+        self.assertEqual(form_data["client_id"], ["test-id"])
+        self.assertEqual(form_data["client_secret"], ["test-secret"])
 
-    @patch("stkai._auth.requests.post")
+    @patch.object(_auth._SESSION, "post")
     def test_get_access_token_returns_cached_token(self, mock_post):
         """Should return cached token if still valid."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "access_token": "cached-token",
-            "expires_in": 1199,
-        }
-        mock_response.raise_for_status = Mock()
-        mock_post.return_value = mock_response
+        mock_post.return_value = make_token_response({"access_token": "cached-token", "expires_in": 1199})
 
         # First call - fetches token
         token1 = self.auth.get_access_token()
@@ -154,17 +178,12 @@ class TestClientCredentialsAuthProviderGetToken(unittest.TestCase):
         # Should only call API once
         self.assertEqual(mock_post.call_count, 1)
 
-    @patch("stkai._auth.requests.post")
-    @patch("stkai._auth.time.time")
+    @patch.object(_auth._SESSION, "post")
+    @patch("stkai._auth.time.monotonic")
     def test_get_access_token_refreshes_expired_token(self, mock_time, mock_post):
         """Should fetch new token when current one is expired."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "access_token": "token",
-            "expires_in": 100,  # Short TTL for testing
-        }
-        mock_response.raise_for_status = Mock()
-        mock_post.return_value = mock_response
+        # Short TTL for testing
+        mock_post.return_value = make_token_response({"access_token": "token", "expires_in": 100})
 
         # First call at time 0
         mock_time.return_value = 0.0
@@ -177,19 +196,29 @@ class TestClientCredentialsAuthProviderGetToken(unittest.TestCase):
         # Should have fetched token twice
         self.assertEqual(mock_post.call_count, 2)
 
-    @patch("stkai._auth.requests.post")
+    @patch.object(_auth._SESSION, "post")
+    @patch("stkai._auth.time.monotonic", return_value=0.0)
+    def test_get_access_token_jitters_refresh_margin(self, mock_time, mock_post):
+        """Should schedule the refresh within ±10% of the refresh margin before expiry."""
+        mock_post.return_value = make_token_response({"access_token": "token", "expires_in": 1000})
+
+        self.auth.get_access_token()
+
+        token = self.auth._token
+        self.assertEqual(token.expires_at, 1000.0)
+        self.assertGreaterEqual(token.refresh_at, 1000.0 - 60 * 1.1)
+        self.assertLessEqual(token.refresh_at, 1000.0 - 60 * 0.9)
+
+    @patch.object(_auth._SESSION, "post")
     def test_get_access_token_raises_on_http_error(self, mock_post):
         """Should raise AuthenticationError on HTTP error."""
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_response.raise_for_status.side_effect = requests.HTTPError(response=mock_response)
-        mock_post.return_value = mock_response
+        mock_post.return_value = make_token_response({}, status_code=401)
 
         with self.assertRaises(AuthenticationError) as context:
             self.auth.get_access_token()
         self.assertIn("Failed to obtain access token", context.exception.message)
 
-    @patch("stkai._auth.requests.post")
+    @patch.object(_auth._SESSION, "post")
     def test_get_access_token_raises_on_connection_error(self, mock_post):
         """Should raise AuthenticationError on connection error."""
         mock_post.side_effect = requests.ConnectionError("Connection refused")
@@ -198,32 +227,96 @@ class TestClientCredentialsAuthProviderGetToken(unittest.TestCase):
             self.auth.get_access_token()
         self.assertIn("Failed to obtain access token", context.exception.message)
 
-    @patch("stkai._auth.requests.post")
+    @patch.object(_auth._SESSION, "post")
     def test_get_access_token_raises_on_missing_field(self, mock_post):
         """Should raise AuthenticationError if response missing access_token."""
-        mock_response = Mock()
-        mock_response.json.return_value = {"expires_in": 1199}  # Missing access_token
-        mock_response.raise_for_status = Mock()
-        mock_post.return_value = mock_response
+        mock_post.return_value = make_token_response({"expires_in": 1199})  # Missing access_token
 
         with self.assertRaises(AuthenticationError) as context:
             self.auth.get_access_token()
         self.assertIn("missing", context.exception.message.lower())
 
+    def test_session_is_reused(self):
+        """Should send token requests of every provider through the same pooled session."""
+        other_auth = ClientCredentialsAuthProvider(
+            client_id="other-id",
+            client_secret="other-secret",
+        )
+        mock_response = make_token_response({"access_token": "pooled-token", "expires_in": 1199})
+
+        with patch.object(_auth._SESSION, "post", return_value=mock_response) as mock_post:
+            self.auth.get_access_token()
+            other_auth.get_access_token()
+
+        self.assertIsInstance(_auth._SESSION, requests.Session)
+        self.assertEqual(mock_post.call_count, 2)
+
+    def test_session_retries_transient_failures(self):
+        """Should retry token POSTs on transient statuses, leaving the final status to raise_for_status()."""
+        for url in (ClientCredentialsAuthProvider.DEFAULT_TOKEN_URL, "http://localhost/token"):
+            retry = _auth._SESSION.get_adapter(url).max_retries
+
+            self.assertEqual(retry.total, 3)
+            self.assertIn("POST", retry.allowed_methods)
+            self.assertEqual(set(retry.status_forcelist), {429, 502, 503, 504})
+            self.assertFalse(retry.raise_on_status)
+            self.assertFalse(retry.respect_retry_after_header)
+            self.assertEqual(retry.backoff_max, 1.0)
+
+    def test_retries_on_503(self):
+        """Should transparently retry a token request that got HTTP 503, reusing the session's pool."""
+        attempts = []
+
+        def fake_make_request(pool, conn, method, url, body=None, headers=None, **kwargs):
+            attempts.append(url)
+            if len(attempts) < 3:
+                status, payload = 503, b""
+            else:
+                status, payload = 200, json.dumps({"access_token": "retried-token", "expires_in": 1199}).encode()
+            return HTTPResponse(
+                body=io.BytesIO(payload), status=status, preload_content=False,
+                request_method=method, request_url=url,
+            )
+
+        # Patched below requests, at the urllib3 layer where the Retry policy runs
+        with patch.object(HTTPConnectionPool, "_make_request", fake_make_request), \
+                patch("urllib3.util.retry.time.sleep"):
+            token = self.auth.get_access_token()
+
+        self.assertEqual(token, "retried-token")
+        self.assertEqual(len(attempts), 3)
+
+
+    def test_retries_ignore_retry_after_header(self):
+        """Should keep its own short backoff even when the server asks to wait much longer."""
+        attempts = []
+
+        def fake_make_request(pool, conn, method, url, body=None, headers=None, **kwargs):
+            attempts.append(url)
+            if len(attempts) < 4:
+                status, payload, response_headers = 429, b"", {"Retry-After": "600"}
+            else:
+                status, payload, response_headers = 200, json.dumps({"access_token": "t", "expires_in": 1199}).encode(), {}
+            return HTTPResponse(
+                body=io.BytesIO(payload), status=status, headers=response_headers, preload_content=False,
+                request_method=method, request_url=url,
+            )
+
+        with patch.object(HTTPConnectionPool, "_make_request", fake_make_request), \
+                patch("urllib3.util.retry.time.sleep") as mock_sleep:
+            self.auth.get_access_token()
+
+        self.assertEqual(len(attempts), 4)
+        self.assertLessEqual(sum(call.args[0] for call in mock_sleep.call_args_list), 1.5)
+
 
 class TestClientCredentialsAuthProviderGetAuthHeaders(unittest.TestCase):
     """Tests for ClientCredentialsAuthProvider.get_auth_headers()."""
 
-    @patch("stkai._auth.requests.post")
+    @patch.object(_auth._SESSION, "post")
     def test_get_auth_headers_returns_bearer_token(self, mock_post):
         """Should return Authorization header with Bearer token."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "access_token": "test-token",
-            "expires_in": 1199,
-        }
-        mock_response.raise_for_status = Mock()
-        mock_post.return_value = mock_response
+        mock_post.return_value = make_token_response({"access_token": "test-token", "expires_in": 1199})
 
         auth = ClientCredentialsAuthProvider(
             client_id="test-id",
@@ -231,13 +324,28 @@ class TestClientCredentialsAuthProviderGetAuthHeaders(unittest.TestCase):
         )
         headers = auth.get_auth_headers()
 
-        self.assertEqual(headers, {"Authorization": "Bearer test-token"})
+        self.assertEqual(dict(headers), {"Authorization": "Bearer test-token"})
+
+    @patch.object(_auth._SESSION, "post")
+    def test_get_auth_headers_is_cached_and_immutable(self, mock_post):
+        """Should return the same read-only headers while the token is valid."""
+        mock_post.return_value = make_token_response({"access_token": "test-token", "expires_in": 1199})
+
+        auth = ClientCredentialsAuthProvider(
+            client_id="test-id",
+            client_secret="test-secret",
+        )
+        headers = auth.get_auth_headers()
+
+        self.assertIs(auth.get_auth_headers(), headers)
+        with self.assertRaises(TypeError):
+            headers["X-Other"] = "value"  # type: ignore[index]
 
 
 class TestClientCredentialsAuthProviderThreadSafety(unittest.TestCase):
     """Tests for ClientCredentialsAuthProvider thread safety."""
 
-    @patch("stkai._auth.requests.post")
+    @patch.object(_auth._SESSION, "post")
     def test_concurrent_calls_only_fetch_once(self, mock_post):
         """Multiple threads should share cached token."""
         call_count = 0
@@ -246,13 +354,7 @@ class TestClientCredentialsAuthProviderThreadSafety(unittest.TestCase):
             nonlocal call_count
             call_count += 1
             time.sleep(0.1)  # Simulate network latency
-            mock_response = Mock()
-            mock_response.json.return_value = {
-                "access_token": f"token-{call_count}",
-                "expires_in": 1199,
-            }
-            mock_response.raise_for_status = Mock()
-            return mock_response
+            return make_token_response({"access_token": f"token-{call_count}", "expires_in": 1199})
 
         mock_post.side_effect = mock_post_fn
 
@@ -261,29 +363,20 @@ class TestClientCredentialsAuthProviderThreadSafety(unittest.TestCase):
             client_secret="test-secret",
         )
 
-        results = []
-        errors = []
+        # Request tokens from multiple threads released at the same instant
+        # (any exception raised by a worker is re-raised by map())
+        barrier = threading.Barrier(5, timeout=5)
 
-        def get_token():
-            try:
-                token = auth.get_access_token()
-                results.append(token)
-            except Exception as e:
-                errors.append(e)
+        def get_token(_):
+            barrier.wait()
+            return auth.get_access_token()
 
-        # Start multiple threads simultaneously
-        threads = [threading.Thread(target=get_token) for _ in range(5)]
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        results = list(_EXECUTOR.map(get_token, range(5)))
 
-        # Should have no errors
-        self.assertEqual(len(errors), 0)
-        # All threads should get a token
-        self.assertEqual(len(results), 5)
-        # API should only be called once (or twice if race condition)
-        self.assertLessEqual(call_count, 2)
+        # All threads should get the same token
+        self.assertEqual(results, ["token-1"] * 5)
+        # Double-checked locking: only one thread fetches, the others reuse its token
+        self.assertEqual(call_count, 1)
 
 
 class TestCreateStandaloneAuth(unittest.TestCase):
@@ -294,6 +387,7 @@ class TestCreateStandaloneAuth(unittest.TestCase):
 
     def tearDown(self):
         STKAI.reset()
+        _auth._PROVIDER_REGISTRY.clear()
 
     def test_raises_when_no_credentials_configured(self):
         """Should raise ValueError when credentials not configured."""
@@ -330,6 +424,18 @@ class TestCreateStandaloneAuth(unittest.TestCase):
         self.assertEqual(auth._client_secret, "custom-secret")
         self.assertEqual(auth._token_url, "https://custom.url/token")
 
+    def test_same_config_returns_same_instance(self):
+        """Should share one provider (and token cache) between callers with the same credentials."""
+        from stkai._config import AuthConfig
+
+        config = AuthConfig(client_id="shared-id", client_secret="shared-secret")
+        other_config = AuthConfig(client_id="other-id", client_secret="shared-secret")
+
+        auth = create_standalone_auth(config=config)
+
+        self.assertIs(create_standalone_auth(config=config), auth)
+        self.assertIsNot(create_standalone_auth(config=other_config), auth)
+
 
 class TestAuthProviderIsAbstract(unittest.TestCase):
     """Tests for AuthProvider abstract base class."""
@@ -8,14 +8,24 @@ from unittest.mock import patch
 from stkai._cli import StkCLI
 
 
+def make_oscli_stub(**attributes) -> ModuleType:
+    """Creates a fake `oscli` module exposing the given attributes."""
+    stub = ModuleType("oscli")
+    for name, value in attributes.items():
+        setattr(stub, name, value)
+    return stub
+
+
 class TestStkCLIIsAvailable(unittest.TestCase):
     """Tests for StkCLI.is_available() method."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.oscli = make_oscli_stub()
+
     def test_returns_true_when_oscli_installed(self):
         """Should return True when oscli can be imported."""
-        mock_oscli = ModuleType("oscli")
-
-        with patch.dict(sys.modules, {"oscli": mock_oscli}):
+        with patch.dict(sys.modules, {"oscli": self.oscli}):
             self.assertTrue(StkCLI.is_available())
 
     def test_returns_false_when_oscli_not_installed(self):
@@ -28,16 +38,34 @@ class TestStkCLIIsAvailable(unittest.TestCase):
         # Now test without oscli
         self.assertFalse(StkCLI.is_available())
 
+    def test_caches_result_until_cache_is_cleared(self):
+        """Should probe oscli once and reuse the result until the cache is cleared."""
+        with patch.dict(sys.modules, {"oscli": self.oscli}):
+            self.assertTrue(StkCLI.is_available())
+
+        # oscli is gone, but the cached probe still answers
+        with patch.dict(sys.modules, {"oscli": None}):
+            self.assertTrue(StkCLI.is_available())
+
+            StkCLI._clear_cache()
+            self.assertFalse(StkCLI.is_available())
+
 
 class TestStkCLIGetCodebuddyBaseUrl(unittest.TestCase):
     """Tests for StkCLI.get_codebuddy_base_url() method."""
 
+    @classmethod
+    def setUpClass(cls):
+        # Module stubs are never mutated by the tests, so they're built once per class
+        cls.oscli_with_url = make_oscli_stub(__codebuddy_base_url__="https://cli-provided.example.com")
+        cls.oscli_without_url = make_oscli_stub()
+        cls.oscli_with_empty_url = make_oscli_stub(__codebuddy_base_url__="")
+        cls.oscli_with_none_url = make_oscli_stub(__codebuddy_base_url__=None)
+        cls.oscli_with_int_url = make_oscli_stub(__codebuddy_base_url__=12345)  # Not a string
+
     def test_returns_url_when_available(self):
         """Should return CLI's __codebuddy_base_url__ when available."""
-        mock_oscli = ModuleType("oscli")
-        mock_oscli.__codebuddy_base_url__ = "https://cli-provided.example.com"
-
-        with patch.dict(sys.modules, {"oscli": mock_oscli}):
+        with patch.dict(sys.modules, {"oscli": self.oscli_with_url}):
             result = StkCLI.get_codebuddy_base_url()
             self.assertEqual(result, "https://cli-provided.example.com")
 
@@ -52,39 +80,27 @@ class TestStkCLIGetCodebuddyBaseUrl(unittest.TestCase):
 
     def test_returns_none_when_attribute_missing(self):
         """Should return None when __codebuddy_base_url__ attribute is missing."""
-        mock_oscli = ModuleType("oscli")
-        # Don't set __codebuddy_base_url__ attribute
-
-        with patch.dict(sys.modules, {"oscli": mock_oscli}):
+        with patch.dict(sys.modules, {"oscli": self.oscli_without_url}):
             result = StkCLI.get_codebuddy_base_url()
             self.assertIsNone(result)
 
     def test_raises_assertion_error_when_empty_string(self):
         """Should raise AssertionError when __codebuddy_base_url__ is empty string (fail fast)."""
-        mock_oscli = ModuleType("oscli")
-        mock_oscli.__codebuddy_base_url__ = ""
-
-        with patch.dict(sys.modules, {"oscli": mock_oscli}):
+        with patch.dict(sys.modules, {"oscli": self.oscli_with_empty_url}):
             with self.assertRaises(AssertionError) as ctx:
                 StkCLI.get_codebuddy_base_url()
             self.assertIn("must not be empty", str(ctx.exception))
 
     def test_raises_assertion_error_when_none_value(self):
         """Should raise AssertionError when __codebuddy_base_url__ is None (fail fast)."""
-        mock_oscli = ModuleType("oscli")
-        mock_oscli.__codebuddy_base_url__ = None
-
-        with patch.dict(sys.modules, {"oscli": mock_oscli}):
+        with patch.dict(sys.modules, {"oscli": self.oscli_with_none_url}):
             with self.assertRaises(AssertionError) as ctx:
                 StkCLI.get_codebuddy_base_url()
             self.assertIn("must not be empty", str(ctx.exception))
 
     def test_raises_assertion_error_when_not_a_string(self):
         """Should raise AssertionError when __codebuddy_base_url__ is not a string (fail fast)."""
-        mock_oscli = ModuleType("oscli")
-        mock_oscli.__codebuddy_base_url__ = 12345  # Not a string
-
-        with patch.dict(sys.modules, {"oscli": mock_oscli}):
+        with patch.dict(sys.modules, {"oscli": self.oscli_with_int_url}):
             with self.assertRaises(AssertionError) as ctx:
                 StkCLI.get_codebuddy_base_url()
             self.assertIn("must be a string", str(ctx.exception))
@@ -121,6 +137,16 @@ class TestStkCLIGetInferenceAppBaseUrl(unittest.TestCase):
 
         self.assertEqual(result, "https://custom-api.example.com")
 
+    @patch.object(StkCLI, "get_codebuddy_base_url")
+    def test_returns_same_string_when_pattern_not_found(self, mock_get_codebuddy):
+        """Should hand back the CLI's URL object itself when there is nothing to rewrite."""
+        codebuddy_url = "https://custom-api.example.com"
+        mock_get_codebuddy.return_value = codebuddy_url
+
+        result = StkCLI.get_inference_app_base_url()
+
+        self.assertIs(result, codebuddy_url)
+
     @patch.object(StkCLI, "get_codebuddy_base_url")
     def test_returns_none_when_codebuddy_url_is_none(self, mock_get_codebuddy):
         """Should return None when get_codebuddy_base_url returns None."""
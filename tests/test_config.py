@@ -21,10 +21,13 @@ from stkai._config import (
 class TestDefaults(unittest.TestCase):
     """Tests for default configuration values."""
 
-    def setUp(self):
+    # Tests only read the config, so one reset per class is enough
+    @classmethod
+    def setUpClass(cls):
         STKAI.reset()
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         STKAI.reset()
 
     def test_rqc_defaults(self):
@@ -35,6 +38,8 @@ class TestDefaults(unittest.TestCase):
         self.assertEqual(STKAI.config.rqc.poll_interval, 10.0)
         self.assertEqual(STKAI.config.rqc.poll_max_duration, 600.0)
         self.assertEqual(STKAI.config.rqc.poll_overload_timeout, 60.0)
+        self.assertEqual(STKAI.config.rqc.poll_backoff_factor, 1.0)
+        self.assertEqual(STKAI.config.rqc.poll_max_interval, 60.0)
         self.assertEqual(STKAI.config.rqc.max_workers, 8)
         self.assertEqual(STKAI.config.rqc.base_url, "https://genai-code-buddy-api.stackspot.com")
 
@@ -208,6 +213,20 @@ class TestSTKAIReset(unittest.TestCase):
         # STKAI.config should return same values
         self.assertEqual(result.rqc.request_timeout, STKAI.config.rqc.request_timeout)
 
+    def test_reset_reuses_env_layer_until_env_changes(self):
+        """STKAI.reset() should only re-parse env vars when STKAI_* variables change."""
+        with patch.object(STKAIConfig, "with_env_vars", autospec=True, side_effect=STKAIConfig.with_env_vars) as spy:
+            STKAI.reset()
+            STKAI.reset()
+            self.assertLessEqual(spy.call_count, 1)
+
+            with patch.dict(os.environ, {"STKAI_RQC_REQUEST_TIMEOUT": "77"}):
+                STKAI.reset()
+                self.assertEqual(STKAI.config.rqc.request_timeout, 77)
+
+            STKAI.reset()
+            self.assertEqual(STKAI.config.rqc.request_timeout, 30)
+
 
 class TestAllEnvVars(unittest.TestCase):
     """Tests to ensure all env vars work correctly."""
@@ -228,6 +247,8 @@ class TestAllEnvVars(unittest.TestCase):
             "STKAI_RQC_POLL_INTERVAL": "20.0",
             "STKAI_RQC_POLL_MAX_DURATION": "900.0",
             "STKAI_RQC_POLL_OVERLOAD_TIMEOUT": "120.0",
+            "STKAI_RQC_POLL_BACKOFF_FACTOR": "1.5",
+            "STKAI_RQC_POLL_MAX_INTERVAL": "45.0",
             "STKAI_RQC_MAX_WORKERS": "16",
         },
     )
@@ -241,6 +262,8 @@ class TestAllEnvVars(unittest.TestCase):
         self.assertEqual(STKAI.config.rqc.poll_interval, 20.0)
         self.assertEqual(STKAI.config.rqc.poll_max_duration, 900.0)
         self.assertEqual(STKAI.config.rqc.poll_overload_timeout, 120.0)
+        self.assertEqual(STKAI.config.rqc.poll_backoff_factor, 1.5)
+        self.assertEqual(STKAI.config.rqc.poll_max_interval, 45.0)
         self.assertEqual(STKAI.config.rqc.max_workers, 16)
 
     @patch.dict(
@@ -301,16 +324,17 @@ class TestWithOverrides(unittest.TestCase):
             config.with_overrides({"request_timout": 60})  # typo
         self.assertIn("request_timout", str(context.exception))
 
+    def test_with_overrides_typo_with_none_value_raises_error(self):
+        """with_overrides() should reject unknown fields even when their value is None."""
+        config = RqcConfig()
+        with self.assertRaises(ValueError) as context:
+            config.with_overrides({"request_timout": None})  # typo
+        self.assertIn("request_timout", str(context.exception))
+
 
 class TestDataclassImmutability(unittest.TestCase):
     """Tests for dataclass immutability (frozen=True)."""
 
-    def setUp(self):
-        STKAI.reset()
-
-    def tearDown(self):
-        STKAI.reset()
-
     def test_rqc_config_is_frozen(self):
         """RqcConfig should be immutable."""
         config = RqcConfig()
@@ -372,10 +396,13 @@ class TestSTKAIRepr(unittest.TestCase):
 class TestRateLimitConfigDefaults(unittest.TestCase):
     """Tests for RateLimitConfig default values."""
 
-    def setUp(self):
+    # Tests only read the config, so one reset per class is enough
+    @classmethod
+    def setUpClass(cls):
         STKAI.reset()
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         STKAI.reset()
 
     def test_rate_limit_disabled_by_default(self):
@@ -485,6 +512,12 @@ class TestRateLimitConfigPresets(unittest.TestCase):
 
         STKAI.reset()
 
+    def test_to_dict_matches_asdict(self):
+        """to_dict() should return the same fields and values as dataclasses.asdict()."""
+        preset = RateLimitConfig.conservative_preset(max_requests=25)
+        self.assertEqual(preset.to_dict(), asdict(preset))
+        self.assertEqual(list(preset.to_dict()), list(asdict(preset)))
+
     def test_presets_are_valid_configs(self):
         """All presets should pass validation."""
         # Should not raise
@@ -492,6 +525,18 @@ class TestRateLimitConfigPresets(unittest.TestCase):
         RateLimitConfig.balanced_preset().validate()
         RateLimitConfig.optimistic_preset().validate()
 
+    def test_presets_with_same_arguments_are_shared(self):
+        """Presets are frozen, so identical calls should return the same instance."""
+        self.assertIs(RateLimitConfig.balanced_preset(), RateLimitConfig.balanced_preset())
+        self.assertIs(
+            RateLimitConfig.conservative_preset(max_requests=50),
+            RateLimitConfig.conservative_preset(max_requests=50),
+        )
+        self.assertIsNot(
+            RateLimitConfig.optimistic_preset(max_requests=80),
+            RateLimitConfig.optimistic_preset(max_requests=180),
+        )
+
 
 class TestRateLimitConfigure(unittest.TestCase):
     """Tests for configuring rate limiting via STKAI.configure()."""
@@ -1469,6 +1514,18 @@ class TestConfigValidation(unittest.TestCase):
             RqcConfig(poll_overload_timeout=-1).validate()
         self.assertIn("poll_overload_timeout", str(ctx.exception))
 
+    def test_rqc_poll_backoff_factor_must_be_at_least_one(self):
+        """poll_backoff_factor must be >= 1.0."""
+        with self.assertRaises(ConfigValidationError) as ctx:
+            RqcConfig(poll_backoff_factor=0.5).validate()
+        self.assertIn("poll_backoff_factor", str(ctx.exception))
+
+    def test_rqc_poll_max_interval_must_be_positive(self):
+        """poll_max_interval must be > 0."""
+        with self.assertRaises(ConfigValidationError) as ctx:
+            RqcConfig(poll_max_interval=0).validate()
+        self.assertIn("poll_max_interval", str(ctx.exception))
+
     def test_rqc_max_workers_must_be_positive(self):
         """max_workers must be > 0."""
         with self.assertRaises(ConfigValidationError) as ctx:
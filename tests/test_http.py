@@ -1,6 +1,7 @@
 """Tests for HTTP client implementations."""
 
 import threading
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -19,14 +20,17 @@ from stkai import (
 # =============================================================================
 
 
+# Shared response: delegation tests only check the recorded calls, never the response itself
+_OK = SimpleNamespace(status_code=200)
+
+
 class MockHttpClient(HttpClient):
     """Mock HTTP client for testing."""
 
     def __init__(self):
         self.get_calls = []
         self.post_calls = []
-        self.response = MagicMock(spec=requests.Response)
-        self.response.status_code = 200
+        self.response = _OK
 
     def get(self, url, headers=None, timeout=30):
         self.get_calls.append({"url": url, "headers": headers, "timeout": timeout})
@@ -230,6 +234,11 @@ class TestStandaloneHttpClientInit:
 
         assert client._auth == auth
 
+    def test_init_creates_one_session_for_connection_reuse(self):
+        client = StandaloneHttpClient(auth_provider=MockAuthProvider())
+
+        assert isinstance(client._session, requests.Session)
+
     def test_init_fails_when_auth_provider_is_none(self):
         with pytest.raises(AssertionError, match="auth_provider cannot be None"):
             StandaloneHttpClient(auth_provider=None)
@@ -251,7 +260,7 @@ class TestStandaloneHttpClientGet:
         client = StandaloneHttpClient(auth_provider=auth)
         mock_response = MagicMock(spec=requests.Response)
 
-        with patch("requests.get", return_value=mock_response) as mock_get:
+        with patch.object(client._session, "get", return_value=mock_response) as mock_get:
             client.get("http://example.com/api")
 
             mock_get.assert_called_once()
@@ -264,7 +273,7 @@ class TestStandaloneHttpClientGet:
         client = StandaloneHttpClient(auth_provider=auth)
         mock_response = MagicMock(spec=requests.Response)
 
-        with patch("requests.get", return_value=mock_response) as mock_get:
+        with patch.object(client._session, "get", return_value=mock_response) as mock_get:
             client.get("http://example.com/api", headers={"X-Custom": "value"})
 
             call_kwargs = mock_get.call_args.kwargs
@@ -276,7 +285,7 @@ class TestStandaloneHttpClientGet:
         client = StandaloneHttpClient(auth_provider=auth)
         mock_response = MagicMock(spec=requests.Response)
 
-        with patch("requests.get", return_value=mock_response) as mock_get:
+        with patch.object(client._session, "get", return_value=mock_response) as mock_get:
             # Custom Authorization header should override the auth provider's
             client.get("http://example.com/api", headers={"Authorization": "Custom token"})
 
@@ -288,7 +297,7 @@ class TestStandaloneHttpClientGet:
         client = StandaloneHttpClient(auth_provider=auth)
         mock_response = MagicMock(spec=requests.Response)
 
-        with patch("requests.get", return_value=mock_response) as mock_get:
+        with patch.object(client._session, "get", return_value=mock_response) as mock_get:
             client.get("http://example.com/api/resource", timeout=60)
 
             mock_get.assert_called_once_with(
@@ -302,7 +311,7 @@ class TestStandaloneHttpClientGet:
         client = StandaloneHttpClient(auth_provider=auth)
         mock_response = MagicMock(spec=requests.Response)
 
-        with patch("requests.get", return_value=mock_response) as mock_get:
+        with patch.object(client._session, "get", return_value=mock_response) as mock_get:
             client.get("http://example.com/api")
 
             call_kwargs = mock_get.call_args.kwargs
@@ -345,7 +354,7 @@ class TestStandaloneHttpClientPost:
         client = StandaloneHttpClient(auth_provider=auth)
         mock_response = MagicMock(spec=requests.Response)
 
-        with patch("requests.post", return_value=mock_response) as mock_post:
+        with patch.object(client._session, "post", return_value=mock_response) as mock_post:
             client.post("http://example.com/api", data={"key": "value"})
 
             call_kwargs = mock_post.call_args.kwargs
@@ -356,7 +365,7 @@ class TestStandaloneHttpClientPost:
         client = StandaloneHttpClient(auth_provider=auth)
         mock_response = MagicMock(spec=requests.Response)
 
-        with patch("requests.post", return_value=mock_response) as mock_post:
+        with patch.object(client._session, "post", return_value=mock_response) as mock_post:
             client.post("http://example.com/api", data={"name": "test", "value": 123})
 
             call_kwargs = mock_post.call_args.kwargs
@@ -367,7 +376,7 @@ class TestStandaloneHttpClientPost:
         client = StandaloneHttpClient(auth_provider=auth)
         mock_response = MagicMock(spec=requests.Response)
 
-        with patch("requests.post", return_value=mock_response) as mock_post:
+        with patch.object(client._session, "post", return_value=mock_response) as mock_post:
             client.post("http://example.com/api", headers={"Content-Type": "application/json"})
 
             call_kwargs = mock_post.call_args.kwargs
@@ -379,7 +388,7 @@ class TestStandaloneHttpClientPost:
         client = StandaloneHttpClient(auth_provider=auth)
         mock_response = MagicMock(spec=requests.Response)
 
-        with patch("requests.post", return_value=mock_response) as mock_post:
+        with patch.object(client._session, "post", return_value=mock_response) as mock_post:
             client.post("http://example.com/api/create", data={}, timeout=90)
 
             mock_post.assert_called_once_with(
@@ -394,7 +403,7 @@ class TestStandaloneHttpClientPost:
         client = StandaloneHttpClient(auth_provider=auth)
         mock_response = MagicMock(spec=requests.Response)
 
-        with patch("requests.post", return_value=mock_response) as mock_post:
+        with patch.object(client._session, "post", return_value=mock_response) as mock_post:
             client.post("http://example.com/api")
 
             call_kwargs = mock_post.call_args.kwargs
@@ -405,7 +414,7 @@ class TestStandaloneHttpClientPost:
         client = StandaloneHttpClient(auth_provider=auth)
         mock_response = MagicMock(spec=requests.Response)
 
-        with patch("requests.post", return_value=mock_response) as mock_post:
+        with patch.object(client._session, "post", return_value=mock_response) as mock_post:
             client.post("http://example.com/api")
 
             call_kwargs = mock_post.call_args.kwargs
@@ -699,13 +708,12 @@ class TestEnvironmentAwareHttpClientLazyInitialization:
         from concurrent.futures import ThreadPoolExecutor
 
         client = EnvironmentAwareHttpClient()
-        creation_count = 0
-        creation_lock = threading.Lock()
+        # list.append is atomic, so recording creations needs no test-side lock
+        # (a lock here would serialize the very race being tested)
+        creations: list[int] = []
 
         def counting_create_delegate():
-            nonlocal creation_count
-            with creation_lock:
-                creation_count += 1
+            creations.append(threading.get_ident())
             time.sleep(0.01)  # Simulate slow creation to increase race condition window
             return MockHttpClient()
 
@@ -721,5 +729,5 @@ class TestEnvironmentAwareHttpClientLazyInitialization:
                     f.result()
 
         # Delegate should be created exactly once
-        assert creation_count == 1
+        assert len(creations) == 1
         assert client._delegate is not None
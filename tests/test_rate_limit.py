@@ -1,6 +1,10 @@
 """Tests for rate limiting implementations."""
 
+import atexit
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -16,6 +20,21 @@ from stkai import (
 )
 from stkai._rate_limit import Jitter
 
+# Shared thread pool for concurrency tests (avoids spawning new threads per test)
+_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="test-rate-limit")
+atexit.register(_EXECUTOR.shutdown)
+
+# requests.Response attribute names, introspected once instead of on every MagicMock(spec=...)
+_RESPONSE_SPEC = dir(requests.Response)
+
+
+def _mock_response() -> MagicMock:
+    """Creates a requests.Response mock from the precomputed spec."""
+    response = MagicMock(spec=_RESPONSE_SPEC)
+    response.__class__ = requests.Response  # keeps isinstance() checks passing
+    return response
+
+
 # =============================================================================
 # Exception Hierarchy Tests
 # =============================================================================
@@ -55,7 +74,7 @@ class TestExceptionHierarchy:
 
     def test_server_side_error_contains_response(self):
         """ServerSideRateLimitError should contain the HTTP response."""
-        mock_response = MagicMock(spec=requests.Response)
+        mock_response = _mock_response()
         mock_response.status_code = 429
         mock_response.headers = {"Retry-After": "10"}
 
@@ -248,23 +267,144 @@ class TestTokenAcquisitionTimeoutError:
 # =============================================================================
 
 
+@dataclass(frozen=True, slots=True)
+class FakeResponse:
+    """Lightweight stand-in for `requests.Response` (rate limiters only read these fields)."""
+
+    status_code: int = 200
+    headers: dict[str, str] = field(default_factory=dict)
+
+
 class MockHttpClient(HttpClient):
-    """Mock HTTP client for testing."""
+    """
+    Mock HTTP client for testing.
+
+    Calls are recorded column by column (one list per argument) instead of one
+    dict per call; `get_calls`/`post_calls` rebuild the per-call view on demand.
+    """
+
+    # Shared across instances: FakeResponse is immutable, so tests swap in a new one instead of mutating it
+    _OK = FakeResponse()
 
     def __init__(self):
-        self.get_calls = []
-        self.post_calls = []
-        self.response = MagicMock(spec=requests.Response)
-        self.response.status_code = 200
+        self.get_urls = []
+        self.get_headers = []
+        self.get_timeouts = []
+        self.post_urls = []
+        self.post_data = []
+        self.post_headers = []
+        self.post_timeouts = []
+        self.response = self._OK
+
+    def reset(self):
+        """Clears recorded calls and restores the default response, so one instance can be reused."""
+        for column in (
+            self.get_urls, self.get_headers, self.get_timeouts,
+            self.post_urls, self.post_data, self.post_headers, self.post_timeouts,
+        ):
+            column.clear()
+        self.response = self._OK
+
+    @property
+    def get_calls(self):
+        return [
+            {"url": url, "headers": headers, "timeout": timeout}
+            for url, headers, timeout in zip(self.get_urls, self.get_headers, self.get_timeouts, strict=True)
+        ]
+
+    @property
+    def post_calls(self):
+        return [
+            {"url": url, "data": data, "headers": headers, "timeout": timeout}
+            for url, data, headers, timeout in zip(
+                self.post_urls, self.post_data, self.post_headers, self.post_timeouts, strict=True
+            )
+        ]
 
     def get(self, url, headers=None, timeout=30):
-        self.get_calls.append({"url": url, "headers": headers, "timeout": timeout})
+        self.get_urls.append(url)
+        self.get_headers.append(headers)
+        self.get_timeouts.append(timeout)
         return self.response
 
     def post(self, url, data=None, headers=None, timeout=30):
-        self.post_calls.append({"url": url, "data": data, "headers": headers, "timeout": timeout})
+        self.post_urls.append(url)
+        self.post_data.append(data)
+        self.post_headers.append(headers)
+        self.post_timeouts.append(timeout)
+        return self.response
+
+
+class ConcurrencyTrackingHttpClient(HttpClient):
+    """Slow mock HTTP client that records the peak number of concurrent POSTs."""
+
+    def __init__(self, delay: float, response: FakeResponse | None = None):
+        self.delay = delay
+        self.response = response or FakeResponse()
+        self.post_count = 0
+        self.max_concurrent = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def get(self, url, headers=None, timeout=30):
         return self.response
 
+    def post(self, url, data=None, headers=None, timeout=30):
+        with self._lock:
+            self.post_count += 1
+            self._in_flight += 1
+            self.max_concurrent = max(self.max_concurrent, self._in_flight)
+        try:
+            time.sleep(self.delay)
+            return self.response
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+
+# =============================================================================
+# FakeClock
+# =============================================================================
+
+
+class FakeClock:
+    """
+    Deterministic monotonic clock for rate limiting tests.
+
+    Sleeping advances the clock instantly, so refill and wait behavior can be
+    verified without burning real time.
+    """
+
+    def __init__(self, start: float = 1000.0):
+        self.now_ns = round(start * 1_000_000_000)
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now_ns / 1_000_000_000
+
+    def monotonic_ns(self) -> int:
+        return self.now_ns
+
+    def sleep(self, seconds: float, *args, **kwargs) -> None:
+        self.sleeps.append(seconds)
+        self.advance(seconds)
+
+    def advance(self, seconds: float) -> None:
+        self.now_ns += round(seconds * 1_000_000_000)
+
+
+@pytest.fixture
+def fake_clock():
+    """Patches the clock and sleep functions used by the rate limiters with a FakeClock."""
+    clock = FakeClock()
+    with (
+        patch("stkai._rate_limit.time.monotonic", clock.monotonic),
+        patch("stkai._rate_limit.time.monotonic_ns", clock.monotonic_ns),
+        patch("stkai._rate_limit.time.sleep", clock.sleep),
+        patch("stkai._rate_limit.sleep_with_jitter", clock.sleep),
+    ):
+        yield clock
+
 
 # =============================================================================
 # TokenBucketRateLimitedHttpClient Tests
@@ -309,27 +449,21 @@ class TestRateLimitedHttpClientInit:
 
         assert client.max_wait_time is None
 
-    def test_init_fails_when_max_wait_time_is_zero(self):
-        delegate = MockHttpClient()
-
-        with pytest.raises(AssertionError, match="max_wait_time must be > 0 or None"):
-            TokenBucketRateLimitedHttpClient(
-                delegate=delegate,
-                max_requests=10,
-                time_window=60.0,
-                max_wait_time=0,
-            )
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"delegate": None}, "Delegate HTTP client is required"),
+            ({"max_requests": 0}, "max_requests must be greater than 0"),
+            ({"time_window": 0}, "time_window must be greater than 0"),
+            ({"max_wait_time": 0}, "max_wait_time must be > 0 or None"),
+            ({"max_wait_time": -1.0}, "max_wait_time must be > 0 or None"),
+        ],
+    )
+    def test_init_fails_on_invalid_args(self, kwargs, message):
+        args = {"delegate": MockHttpClient(), "max_requests": 10, "time_window": 60.0} | kwargs
 
-    def test_init_fails_when_max_wait_time_is_negative(self):
-        delegate = MockHttpClient()
-
-        with pytest.raises(AssertionError, match="max_wait_time must be > 0 or None"):
-            TokenBucketRateLimitedHttpClient(
-                delegate=delegate,
-                max_requests=10,
-                time_window=60.0,
-                max_wait_time=-1.0,
-            )
+        with pytest.raises(AssertionError, match=message):
+            TokenBucketRateLimitedHttpClient(**args)
 
 
 class TestRateLimitedHttpClientTimeout:
@@ -385,8 +519,117 @@ class TestRateLimitedHttpClientTimeout:
         response = client.get("http://example.com")
 
         assert response.status_code == 200
+        assert delegate.get_calls == [{"url": "http://example.com", "headers": None, "timeout": 30}]
 
 
+class TestRateLimitedHttpClientRateLimiting:
+    """Tests for TokenBucketRateLimitedHttpClient token consumption and refill."""
+
+    @classmethod
+    def setup_class(cls):
+        cls.delegate = MockHttpClient()
+
+    def setup_method(self):
+        # Limiters stay per-test: each one needs its own rate and must read the FakeClock at construction
+        self.delegate.reset()
+
+    def test_allows_requests_up_to_max_requests(self, fake_clock):
+        delegate = self.delegate
+        client = TokenBucketRateLimitedHttpClient(
+            delegate=delegate,
+            max_requests=3,
+            time_window=1.0,
+        )
+
+        for _ in range(3):
+            client.post("http://example.com", data={})
+
+        assert len(delegate.post_urls) == 3
+        assert fake_clock.sleeps == []
+
+    def test_blocks_when_rate_limit_exceeded(self, fake_clock):
+        delegate = self.delegate
+        client = TokenBucketRateLimitedHttpClient(
+            delegate=delegate,
+            max_requests=2,
+            time_window=1.0,
+        )
+
+        for _ in range(3):
+            client.post("http://example.com", data={})
+
+        # Third request waits for exactly one token to refill: 1 / (2 req/s) = 0.5s
+        assert len(delegate.post_urls) == 3
+        assert fake_clock.sleeps == [pytest.approx(0.5)]
+
+    def test_blocked_caller_waits_once_for_next_token(self, fake_clock):
+        delegate = self.delegate
+        client = TokenBucketRateLimitedHttpClient(
+            delegate=delegate,
+            max_requests=3,
+            time_window=1.0,
+        )
+
+        for _ in range(4):
+            client.post("http://example.com", data={})
+
+        # 1/3s is not representable exactly; the wait is rounded up so a single sleep suffices (no re-polling)
+        assert len(delegate.post_urls) == 4
+        assert fake_clock.sleeps == [pytest.approx(1 / 3)]
+
+    def test_tokens_refill_over_time(self, fake_clock):
+        delegate = self.delegate
+        client = TokenBucketRateLimitedHttpClient(
+            delegate=delegate,
+            max_requests=2,
+            time_window=1.0,
+        )
+
+        # Exhaust the bucket, then let enough time pass for one token to refill
+        client.post("http://example.com", data={})
+        client.post("http://example.com", data={})
+        fake_clock.advance(0.6)
+
+        client.post("http://example.com", data={})
+
+        assert len(delegate.post_urls) == 3
+        assert fake_clock.sleeps == []
+
+    def test_tokens_never_exceed_max_requests(self, fake_clock):
+        delegate = self.delegate
+        client = TokenBucketRateLimitedHttpClient(
+            delegate=delegate,
+            max_requests=2,
+            time_window=1.0,
+        )
+
+        # A long idle period must not accumulate more than max_requests tokens
+        fake_clock.advance(60.0)
+        for _ in range(3):
+            client.post("http://example.com", data={})
+
+        assert fake_clock.sleeps == [pytest.approx(0.5)]
+
+    def test_raises_timeout_error_after_waiting(self, fake_clock):
+        delegate = self.delegate
+        client = TokenBucketRateLimitedHttpClient(
+            delegate=delegate,
+            max_requests=1,
+            time_window=1.0,
+            max_wait_time=0.5,
+        )
+
+        client.post("http://example.com", data={})
+
+        # Next token takes 1s to refill, longer than max_wait_time
+        with pytest.raises(TokenAcquisitionTimeoutError):
+            client.post("http://example.com", data={})
+
+        assert len(delegate.post_urls) == 1
+        assert fake_clock.sleeps == []
+
+
+@pytest.mark.xdist_group(name="rate_limit_threads")
 class TestRateLimitedHttpClientThreadIsolation:
     """Tests for thread isolation in TokenBucketRateLimitedHttpClient."""
 
@@ -400,28 +643,22 @@ class TestRateLimitedHttpClientThreadIsolation:
             max_wait_time=0.2,
         )
 
-        errors = []
-        success_count = [0]
-        lock = threading.Lock()
+        # Preallocated slot per request: each thread writes only its own index, so no lock is needed
+        outcomes: list[object] = [None] * 3
 
-        def make_request():
+        def make_request(idx):
             try:
-                client.post("http://example.com", data={})
-                with lock:
-                    success_count[0] += 1
+                outcomes[idx] = client.post("http://example.com", data={})
             except TokenAcquisitionTimeoutError as e:
-                with lock:
-                    errors.append(e)
+                outcomes[idx] = e
 
-        # Launch 3 threads simultaneously
-        threads = [threading.Thread(target=make_request) for _ in range(3)]
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        # Launch 3 requests simultaneously
+        list(_EXECUTOR.map(make_request, range(3)))
 
         # One should succeed (got the token), others should timeout
-        assert success_count[0] == 1
+        errors = [o for o in outcomes if isinstance(o, TokenAcquisitionTimeoutError)]
+        successes = [o for o in outcomes if isinstance(o, FakeResponse)]
+        assert len(successes) == 1
         assert len(errors) == 2
 
         # Each error should have its own waited time
@@ -472,27 +709,24 @@ class TestAdaptiveRateLimitedHttpClientInit:
 
         assert client.max_wait_time is None
 
-    def test_init_fails_when_max_wait_time_is_zero(self):
-        delegate = MockHttpClient()
-
-        with pytest.raises(AssertionError, match="max_wait_time must be > 0 or None"):
-            AdaptiveRateLimitedHttpClient(
-                delegate=delegate,
-                max_requests=100,
-                time_window=60.0,
-                max_wait_time=0,
-            )
-
-    def test_init_fails_when_max_wait_time_is_negative(self):
-        delegate = MockHttpClient()
-
-        with pytest.raises(AssertionError, match="max_wait_time must be > 0 or None"):
-            AdaptiveRateLimitedHttpClient(
-                delegate=delegate,
-                max_requests=100,
-                time_window=60.0,
-                max_wait_time=-1.0,
-            )
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"delegate": None}, "Delegate HTTP client is required"),
+            ({"max_requests": 0}, "max_requests must be greater than 0"),
+            ({"time_window": 0}, "time_window must be greater than 0"),
+            ({"min_rate_floor": 0}, "min_rate_floor must be between 0"),
+            ({"penalty_factor": 1.0}, "penalty_factor must be between 0 and 1"),
+            ({"recovery_factor": 0}, "recovery_factor must be between 0 and 1"),
+            ({"max_wait_time": 0}, "max_wait_time must be > 0 or None"),
+            ({"max_wait_time": -1.0}, "max_wait_time must be > 0 or None"),
+        ],
+    )
+    def test_init_fails_on_invalid_args(self, kwargs, message):
+        args = {"delegate": MockHttpClient(), "max_requests": 100, "time_window": 60.0} | kwargs
+
+        with pytest.raises(AssertionError, match=message):
+            AdaptiveRateLimitedHttpClient(**args)
 
 
 class TestAdaptiveRateLimitedHttpClientTimeout:
@@ -548,6 +782,45 @@ class TestAdaptiveRateLimitedHttpClientTimeout:
         assert response.status_code == 200
 
 
+class TestAdaptiveRateLimitedHttpClientRateLimiting:
+    """Tests for AdaptiveRateLimitedHttpClient token consumption and refill."""
+
+    def test_blocks_when_rate_limit_exceeded(self, fake_clock):
+        delegate = MockHttpClient()
+        client = AdaptiveRateLimitedHttpClient(
+            delegate=delegate,
+            max_requests=2,
+            time_window=1.0,
+            max_wait_time=None,
+        )
+
+        for _ in range(3):
+            client.post("http://example.com", data={})
+
+        # Third request waits for one token to refill at the effective rate
+        assert len(delegate.post_urls) == 3
+        assert len(fake_clock.sleeps) == 1
+        assert 0 < fake_clock.sleeps[0] <= 0.5
+
+    def test_tokens_refill_over_time(self, fake_clock):
+        delegate = MockHttpClient()
+        client = AdaptiveRateLimitedHttpClient(
+            delegate=delegate,
+            max_requests=2,
+            time_window=1.0,
+            max_wait_time=None,
+        )
+
+        client.post("http://example.com", data={})
+        client.post("http://example.com", data={})
+        fake_clock.advance(0.6)
+
+        client.post("http://example.com", data={})
+
+        assert len(delegate.post_urls) == 3
+        assert fake_clock.sleeps == []
+
+
 class TestAdaptiveRateLimitedHttpClientTokenInvariant:
     """Tests for token bucket invariant in AdaptiveRateLimitedHttpClient."""
 
@@ -587,8 +860,7 @@ class TestAdaptiveRateLimitedHttpClient429Handling:
     def test_raises_server_side_rate_limit_error_on_429_and_adapts_rate(self):
         """Test that 429 applies AIMD penalty and raises ServerSideRateLimitError."""
         delegate = MockHttpClient()
-        delegate.response.status_code = 429
-        delegate.response.headers = {}
+        delegate.response = FakeResponse(status_code=429)
 
         client = AdaptiveRateLimitedHttpClient(
             delegate=delegate,
@@ -607,13 +879,12 @@ class TestAdaptiveRateLimitedHttpClient429Handling:
         # Effective max should be reduced (AIMD penalty applied)
         assert client._effective_max < initial_effective_max
         # Should have made only 1 attempt (no internal retry)
-        assert len(delegate.post_calls) == 1
+        assert len(delegate.post_urls) == 1
 
     def test_server_side_rate_limit_error_contains_response(self):
         """Test that ServerSideRateLimitError contains the response for Retry-After parsing."""
         delegate = MockHttpClient()
-        delegate.response.status_code = 429
-        delegate.response.headers = {"Retry-After": "5"}
+        delegate.response = FakeResponse(status_code=429, headers={"Retry-After": "5"})
 
         client = AdaptiveRateLimitedHttpClient(
             delegate=delegate,
@@ -633,8 +904,6 @@ class TestAdaptiveRateLimitedHttpClient429Handling:
     def test_success_recovers_rate(self):
         """Test that successful requests trigger AIMD recovery."""
         delegate = MockHttpClient()
-        delegate.response.status_code = 200
-        delegate.response.headers = {}
 
         client = AdaptiveRateLimitedHttpClient(
             delegate=delegate,
@@ -655,10 +924,40 @@ class TestAdaptiveRateLimitedHttpClient429Handling:
         # Recovery: 50 + (100 * 0.1 * 1.0) = 60
         assert client._effective_max == 60.0
 
+    def test_effective_max_never_exceeds_original(self):
+        """Test that recovery is clamped to max_requests."""
+        delegate = MockHttpClient()
+
+        client = AdaptiveRateLimitedHttpClient(
+            delegate=delegate,
+            max_requests=100,
+            time_window=60.0,
+            recovery_factor=0.5,  # 50% recovery overshoots after one call
+            max_wait_time=None,
+        )
+        client._effective_max = 80.0
+        client._jitter.next = MagicMock(return_value=1.0)
+
+        # First call clamps (80 + 50 -> 100), second call must stay at the clamp
+        for _ in range(2):
+            client.post("http://example.com", data={})
+
+        assert client._effective_max == 100.0
+
 
 class TestAdaptiveRateLimitedHttpClientJitter:
     """Tests for jitter behavior in AdaptiveRateLimitedHttpClient."""
 
+    @staticmethod
+    def _new_client(**factors) -> AdaptiveRateLimitedHttpClient:
+        """Builds a fresh client with the given AIMD factors (e.g. recovery_factor=0.1)."""
+        return AdaptiveRateLimitedHttpClient(
+            delegate=MockHttpClient(),
+            max_requests=100,
+            time_window=60.0,
+            **factors,
+        )
+
     def test_init_creates_jitter_with_deterministic_rng(self):
         """Jitter should use a per-process seeded RNG for structural jitter."""
         delegate = MockHttpClient()
@@ -697,13 +996,7 @@ class TestAdaptiveRateLimitedHttpClientJitter:
 
     def test_on_success_applies_jittered_recovery(self):
         """Recovery factor should vary with ±20% jitter."""
-        delegate = MockHttpClient()
-        client = AdaptiveRateLimitedHttpClient(
-            delegate=delegate,
-            max_requests=100,
-            time_window=60.0,
-            recovery_factor=0.1,
-        )
+        client = self._new_client(recovery_factor=0.1)
 
         client._effective_max = 50.0
         # Mock Jitter's RNG to return 0.8 (lower bound of ±20% jitter)
@@ -716,13 +1009,7 @@ class TestAdaptiveRateLimitedHttpClientJitter:
 
     def test_on_success_uses_jitter(self):
         """Recovery should use jitter for desynchronization."""
-        delegate = MockHttpClient()
-        client = AdaptiveRateLimitedHttpClient(
-            delegate=delegate,
-            max_requests=100,
-            time_window=60.0,
-            recovery_factor=0.1,
-        )
+        client = self._new_client(recovery_factor=0.1)
 
         client._effective_max = 50.0
         client._jitter.next = MagicMock(return_value=1.0)
@@ -734,13 +1021,7 @@ class TestAdaptiveRateLimitedHttpClientJitter:
 
     def test_on_rate_limited_applies_jittered_penalty(self):
         """Penalty factor should vary with ±20% jitter."""
-        delegate = MockHttpClient()
-        client = AdaptiveRateLimitedHttpClient(
-            delegate=delegate,
-            max_requests=100,
-            time_window=60.0,
-            penalty_factor=0.3,
-        )
+        client = self._new_client(penalty_factor=0.3)
 
         client._effective_max = 100.0
         # Mock Jitter's RNG to return 1.2 (upper bound of ±20% jitter)
@@ -753,13 +1034,7 @@ class TestAdaptiveRateLimitedHttpClientJitter:
 
     def test_on_rate_limited_uses_jitter(self):
         """Penalty should use jitter for desynchronization."""
-        delegate = MockHttpClient()
-        client = AdaptiveRateLimitedHttpClient(
-            delegate=delegate,
-            max_requests=100,
-            time_window=60.0,
-            penalty_factor=0.3,
-        )
+        client = self._new_client(penalty_factor=0.3)
 
         client._effective_max = 100.0
         client._jitter.next = MagicMock(return_value=1.0)
@@ -880,31 +1155,34 @@ class TestCongestionAwareHttpClientInit:
 class TestCongestionAwareHttpClientDelegation:
     """Tests for request delegation."""
 
-    def test_get_delegates_to_underlying_client(self):
-        """GET requests should pass through directly."""
+    @classmethod
+    def setup_class(cls):
         from stkai import CongestionAwareHttpClient
 
-        delegate = MagicMock(spec=HttpClient)
-        mock_response = MagicMock(spec=requests.Response)
-        delegate.get.return_value = mock_response
+        # Delegation tests don't depend on limiter state, so one client serves the whole class
+        cls.delegate = MagicMock(spec=HttpClient)
+        cls.client = CongestionAwareHttpClient(delegate=cls.delegate)
 
-        client = CongestionAwareHttpClient(delegate=delegate)
-        response = client.get("https://example.com", {"X-Test": "1"}, timeout=60)
+    def setup_method(self):
+        self.delegate.reset_mock(return_value=True)
+
+    def test_get_delegates_to_underlying_client(self):
+        """GET requests should pass through directly."""
+        mock_response = _mock_response()
+        self.delegate.get.return_value = mock_response
+
+        response = self.client.get("https://example.com", {"X-Test": "1"}, timeout=60)
 
         assert response is mock_response
-        delegate.get.assert_called_once_with("https://example.com", {"X-Test": "1"}, 60)
+        self.delegate.get.assert_called_once_with("https://example.com", {"X-Test": "1"}, 60)
 
     def test_post_delegates_to_underlying_client(self):
         """POST requests should delegate to underlying client."""
-        from stkai import CongestionAwareHttpClient
-
-        delegate = MagicMock(spec=HttpClient)
-        mock_response = MagicMock(spec=requests.Response)
+        mock_response = _mock_response()
         mock_response.status_code = 200
-        delegate.post.return_value = mock_response
+        self.delegate.post.return_value = mock_response
 
-        client = CongestionAwareHttpClient(delegate=delegate)
-        response = client.post(
+        response = self.client.post(
             "https://example.com",
             data={"key": "value"},
             headers={"X-Test": "1"},
@@ -912,72 +1190,36 @@ class TestCongestionAwareHttpClientDelegation:
         )
 
         assert response is mock_response
-        delegate.post.assert_called_once_with(
+        self.delegate.post.assert_called_once_with(
             "https://example.com", {"key": "value"}, {"X-Test": "1"}, 60
         )
 
 
+@pytest.mark.xdist_group(name="rate_limit_threads")
 class TestCongestionAwareHttpClientConcurrency:
     """Tests for concurrency control via semaphore."""
 
+    @pytest.mark.slow
     def test_limits_concurrent_requests(self):
         """Should limit concurrent in-flight requests."""
-        import time
-
         from stkai import CongestionAwareHttpClient
 
-        delegate = MagicMock(spec=HttpClient)
-        mock_response = MagicMock(spec=requests.Response)
-        mock_response.status_code = 200
-
-        # Simulate slow response
-        def slow_post(*args, **kwargs):
-            time.sleep(0.1)
-            return mock_response
-
-        delegate.post.side_effect = slow_post
-
+        delegate = ConcurrencyTrackingHttpClient(delay=0.1)
         client = CongestionAwareHttpClient(delegate=delegate, max_concurrency=2)
 
-        # Track concurrent calls
-        concurrent_count = 0
-        max_concurrent = 0
-        lock = threading.Lock()
-
-        original_post = client.delegate.post
-
-        def tracking_post(*args, **kwargs):
-            nonlocal concurrent_count, max_concurrent
-            with lock:
-                concurrent_count += 1
-                max_concurrent = max(max_concurrent, concurrent_count)
-            try:
-                return original_post(*args, **kwargs)
-            finally:
-                with lock:
-                    concurrent_count -= 1
-
-        client.delegate.post = tracking_post
-
-        # Launch more threads than max_concurrency
-        threads = []
-        for _ in range(5):
-            t = threading.Thread(target=lambda: client.post("https://example.com"))
-            threads.append(t)
-            t.start()
-
-        for t in threads:
-            t.join()
+        # Launch more requests than max_concurrency
+        list(_EXECUTOR.map(lambda _: client.post("https://example.com"), range(5)))
 
         # Max concurrent should not exceed max_concurrency
-        assert max_concurrent <= 2
+        assert delegate.post_count == 5
+        assert delegate.max_concurrent <= 2
 
     def test_releases_semaphore_on_success(self):
         """Should release semaphore slot after successful request."""
         from stkai import CongestionAwareHttpClient
 
         delegate = MagicMock(spec=HttpClient)
-        mock_response = MagicMock(spec=requests.Response)
+        mock_response = _mock_response()
         mock_response.status_code = 200
         delegate.post.return_value = mock_response
 
@@ -1006,7 +1248,7 @@ class TestCongestionAwareHttpClientConcurrency:
 
         # Second request should be able to acquire semaphore
         delegate.post.side_effect = None
-        mock_response = MagicMock(spec=requests.Response)
+        mock_response = _mock_response()
         mock_response.status_code = 200
         delegate.post.return_value = mock_response
 
@@ -1022,7 +1264,7 @@ class TestCongestionAwareHttpClientLatencyEMA:
         from stkai import CongestionAwareHttpClient
 
         delegate = MagicMock(spec=HttpClient)
-        mock_response = MagicMock(spec=requests.Response)
+        mock_response = _mock_response()
         mock_response.status_code = 200
         delegate.post.return_value = mock_response
 
@@ -1044,7 +1286,7 @@ class TestCongestionAwareHttpClientLatencyEMA:
         from stkai import CongestionAwareHttpClient
 
         delegate = MagicMock(spec=HttpClient)
-        mock_response = MagicMock(spec=requests.Response)
+        mock_response = _mock_response()
         mock_response.status_code = 200
         delegate.post.return_value = mock_response
 
@@ -1070,7 +1312,7 @@ class TestCongestionAwareHttpClientLatencyEMA:
         from stkai import CongestionAwareHttpClient
 
         delegate = MagicMock(spec=HttpClient)
-        mock_response = MagicMock(spec=requests.Response)
+        mock_response = _mock_response()
         mock_response.status_code = 429
         delegate.post.return_value = mock_response
 
@@ -1206,6 +1448,7 @@ class TestCongestionAwareHttpClientPressure:
         assert client._concurrency_limit <= 4
 
 
+@pytest.mark.xdist_group(name="rate_limit_threads")
 class TestCongestionAwareHttpClientIntegration:
     """Integration tests for CongestionAwareHttpClient."""
 
@@ -1214,7 +1457,7 @@ class TestCongestionAwareHttpClientIntegration:
         from stkai import AdaptiveRateLimitedHttpClient, CongestionAwareHttpClient
 
         base_delegate = MagicMock(spec=HttpClient)
-        mock_response = MagicMock(spec=requests.Response)
+        mock_response = _mock_response()
         mock_response.status_code = 200
         base_delegate.post.return_value = mock_response
 
@@ -1235,40 +1478,39 @@ class TestCongestionAwareHttpClientIntegration:
         assert response is mock_response
         base_delegate.post.assert_called_once()
 
-    def test_thread_safety(self):
-        """Should be thread-safe under concurrent access."""
-        import time
-
+    def test_sequential_requests(self):
+        """Should delegate every request and release its slot when called in a loop."""
         from stkai import CongestionAwareHttpClient
 
-        delegate = MagicMock(spec=HttpClient)
-        mock_response = MagicMock(spec=requests.Response)
-        mock_response.status_code = 200
+        delegate = ConcurrencyTrackingHttpClient(delay=0)
+        client = CongestionAwareHttpClient(
+            delegate=delegate,
+            max_concurrency=1,
+        )
+
+        for _ in range(10):
+            client.post("https://example.com")
 
-        def variable_latency(*args, **kwargs):
-            time.sleep(0.01)  # Small delay
-            return mock_response
+        assert delegate.post_count == 10
+        assert delegate.max_concurrent == 1
 
-        delegate.post.side_effect = variable_latency
+    def test_thread_safety(self):
+        """Should be thread-safe under concurrent access."""
+        from stkai import CongestionAwareHttpClient
 
+        delegate = ConcurrencyTrackingHttpClient(delay=0.01)  # Small delay
         client = CongestionAwareHttpClient(
             delegate=delegate,
-            max_concurrency=4,
+            max_concurrency=2,
         )
 
-        errors = []
+        def worker(_):
+            for _ in range(2):
+                client.post("https://example.com")
 
-        def worker():
-            try:
-                for _ in range(10):
-                    client.post("https://example.com")
-            except Exception as e:
-                errors.append(e)
-
-        threads = [threading.Thread(target=worker) for _ in range(8)]
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
-        assert len(errors) == 0, f"Errors occurred: {errors}"
+        # A small contention probe: 4 threads racing for 2 slots is enough to exercise the lock.
+        # Any exception raised by a worker is re-raised by map()
+        list(_EXECUTOR.map(worker, range(4)))
+
+        assert delegate.post_count == 8
+        assert delegate.max_concurrent <= 2